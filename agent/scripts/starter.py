@@ -1,5 +1,7 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import os
+import random
 import requests
 import tweepy
 import inquirer
@@ -21,6 +23,7 @@ from src.agent.trading import TradingAgent, TradingPromptGenerator
 from src.datatypes import StrategyData
 from src.container import ContainerManager
 from src.helper import (
+	StreamBuffer,
 	get_ether_address_from_txn_service,
 	services_to_envs,
 	services_to_prompts,
@@ -31,7 +34,9 @@ from src.client.openrouter import OpenRouter
 from src.summarizer import get_summarizer
 from anthropic import Anthropic
 import docker
-from functools import partial
+import docker.errors
+from functools import lru_cache
+from operator import itemgetter
 from src.flows.trading import assisted_flow as trading_assisted_flow
 from src.flows.marketing import unassisted_flow as marketing_unassisted_flow
 from loguru import logger
@@ -44,6 +49,55 @@ from src.twitter import TweepyTwitterClient
 load_dotenv()
 
 
+# Upper bound (seconds) on the wait between consecutive failed cycles
+MAX_FAILURE_BACKOFF = 300
+
+# agent_id -> id of the last strategy run_cycle pushed to the RAG
+_last_saved_strategy_ids: dict[str, str] = {}
+# container identifier -> manager bound to that (already started) container
+_container_managers: dict[str, ContainerManager] = {}
+
+
+@lru_cache(maxsize=1)
+def get_docker_client() -> docker.DockerClient:
+	"""Process-wide Docker client, so each agent start reuses one daemon connection."""
+	return docker.from_env()
+
+
+def get_container_manager(
+	container_identifier: str, in_con_env: dict[str, str]
+) -> ContainerManager:
+	"""Reuse one ContainerManager per executor container across cycles.
+
+	Resolving (or creating) the container costs several Docker API calls, while
+	only the environment passed to each exec changes between cycles. A cached
+	manager is checked with a single reload and rebuilt if its container was
+	removed or recreated in the meantime.
+	"""
+	container_manager = _container_managers.get(container_identifier)
+	if container_manager is not None:
+		try:
+			container_manager.container.reload()
+		except (docker.errors.NotFound, docker.errors.APIError) as e:
+			logger.warning(
+				f"Cached container {container_identifier} is gone, resolving it again: {e}"
+			)
+			del _container_managers[container_identifier]
+			container_manager = None
+
+	if container_manager is None:
+		container_manager = ContainerManager(
+			get_docker_client(),
+			container_identifier,
+			"./code",
+			in_con_env=in_con_env,
+		)
+		_container_managers[container_identifier] = container_manager
+	else:
+		container_manager.in_con_env = in_con_env
+	return container_manager
+
+
 def start_marketing_agent(
 	agent_type: str,
 	session_id: str,
@@ -55,11 +109,9 @@ def start_marketing_agent(
 	db: DBInterface,
 	stream_fn: Callable[[str], None] = lambda x: print(x, flush=True, end=""),
 ):
-	role = fe_data["role"]
-	time_ = fe_data["time"]
-	metric_name = fe_data["metric_name"]
-	notif_sources = fe_data["notifications"]
-	services_used = fe_data["research_tools"]
+	role, time_, metric_name, notif_sources, services_used = itemgetter(
+		"role", "time", "metric_name", "notifications", "research_tools"
+	)(fe_data)
 
 	in_con_env = services_to_envs(services_used)
 	apis = services_to_prompts(services_used)
@@ -69,11 +121,8 @@ def start_marketing_agent(
 
 	prompt_generator = MarketingPromptGenerator(fe_data["prompts"])
 
-	container_manager = ContainerManager(
-		docker.from_env(),
-		"superioragents/agent-executor:latest",
-		"./code",
-		in_con_env=in_con_env,
+	container_manager = get_container_manager(
+		"superioragents/agent-executor:latest", in_con_env
 	)
 
 	summarizer = get_summarizer(genner)
@@ -91,7 +140,7 @@ def start_marketing_agent(
 		rag=rag,
 	)
 
-	flow_func = partial(
+	flow_func = bind_flow(
 		marketing_unassisted_flow,
 		agent=agent,
 		session_id=session_id,
@@ -125,13 +174,23 @@ def start_trading_agent(
 	txn_service_url: str,
 	stream_fn: Callable[[str], None] = lambda x: print(x, flush=True, end=""),
 ):
-	role = fe_data["role"]
-	network = fe_data["network"]
-	services_used = fe_data["research_tools"]
-	trading_instruments = fe_data["trading_instruments"]
-	metric_name = fe_data["metric_name"]
-	notif_sources = fe_data["notifications"]
-	time_ = fe_data["time"]
+	(
+		role,
+		network,
+		services_used,
+		trading_instruments,
+		metric_name,
+		notif_sources,
+		time_,
+	) = itemgetter(
+		"role",
+		"network",
+		"research_tools",
+		"trading_instruments",
+		"metric_name",
+		"notifications",
+		"time",
+	)(fe_data)
 
 	in_con_env = services_to_envs(services_used)
 	apis = services_to_prompts(services_used)
@@ -140,12 +199,7 @@ def start_trading_agent(
 
 	prompt_generator = TradingPromptGenerator(prompts=fe_data["prompts"])
 
-	container_manager = ContainerManager(
-		docker.from_env(),
-		"agent-executor",
-		"./code",
-		in_con_env=in_con_env,
-	)
+	container_manager = get_container_manager("agent-executor", in_con_env)
 
 	summarizer = get_summarizer(genner)
 	previous_strategies = db.fetch_all_strategies(agent_id)
@@ -162,7 +216,7 @@ def start_trading_agent(
 		rag=rag,
 	)
 
-	flow_func = partial(
+	flow_func = bind_flow(
 		trading_assisted_flow,
 		agent=agent,
 		session_id=session_id,
@@ -187,6 +241,18 @@ def start_trading_agent(
 	)
 
 
+def bind_flow(flow: Callable[..., None], **base_params) -> Callable[..., None]:
+	"""Prebind the per-session flow arguments so each cycle only swaps in its two inputs."""
+	ctx = dict(base_params)
+
+	def run(prev_strat: StrategyData | None, notif_str: str | None):
+		ctx["prev_strat"] = prev_strat
+		ctx["notif_str"] = notif_str
+		return flow(**ctx)
+
+	return run
+
+
 def run_cycle(
 	agent: TradingAgent | MarketingAgent,
 	notif_sources: list[str],
@@ -196,15 +262,25 @@ def run_cycle(
 	agent_id: str,
 	fe_data: dict | None = None,
 ):
-	prev_strat = agent.db.fetch_latest_strategy(agent.agent_id)
-	if prev_strat is not None:
-		logger.info(f"Previous strat is {prev_strat}")
-		agent.rag.save_result_batch_v4([prev_strat])
-
 	notif_limit = 5 if fe_data is None else 2  # trading uses 5, marketing uses 2
-	current_notif = agent.db.fetch_latest_notification_str_v2(
-		notif_sources, notif_limit
-	)
+
+	# The strategy and notification lookups are independent, so overlap them; the
+	# notification fetch also keeps running while the RAG save is in flight
+	with ThreadPoolExecutor(max_workers=2) as pool:
+		prev_strat_future = pool.submit(agent.db.fetch_latest_strategy, agent.agent_id)
+		notif_future = pool.submit(
+			agent.db.fetch_latest_notification_str_v2, notif_sources, notif_limit
+		)
+
+		prev_strat = prev_strat_future.result()
+		if prev_strat is not None:
+			logger.info(f"Previous strat is {prev_strat}")
+			# An idle cycle sees the same latest strategy again; don't re-embed it
+			if _last_saved_strategy_ids.get(agent_id) != prev_strat.strategy_id:
+				agent.rag.save_result_batch_v4([prev_strat])
+				_last_saved_strategy_ids[agent_id] = prev_strat.strategy_id
+
+		current_notif = notif_future.result()
 	logger.info(f"Latest notification is {current_notif}")
 	logger.info("Added the previous strat onto the RAG manager")
 
@@ -515,45 +591,55 @@ def starter_prompt():
 		# deepseek_deepseek_client=deepseek_deepseek_client,
 		or_client=or_client,
 		anthropic_client=anthropic_client,
-		stream_fn=lambda token: print(token, end="", flush=True),
+		stream_fn=StreamBuffer().write,
 	)
+	db = SQLiteDB(db_path=os.getenv("SQLITE_PATH", "../db/superior-agents.db"))
+	# Delay after a failed cycle; doubles on every consecutive failure
+	backoff = 1.0
 	# modify this if you want to run this forever
 	for x in range(3):
-		if answers["agent_type"] == "marketing":
-			start_marketing_agent(
-				agent_type=answers["agent_type"],
-				session_id="default_marketing"
-				if answers["agent_type"] == "marketing"
-				else "default_trading",
-				agent_id="default_marketing"
-				if answers["agent_type"] == "marketing"
-				else "default_trading",
-				fe_data=fe_data,
-				genner=genner,
-				db=SQLiteDB(
-					db_path=os.getenv("SQLITE_PATH", "../db/superior-agents.db")
-				),
-				rag=rag_client,
-				sensor=sensor,
-			)
-		elif answers["agent_type"] == "trading":
-			start_trading_agent(
-				agent_type=answers["agent_type"],
-				session_id="default_marketing"
-				if answers["agent_type"] == "marketing"
-				else "default_trading",
-				agent_id="default_marketing"
-				if answers["agent_type"] == "marketing"
-				else "default_trading",
-				fe_data=fe_data,
-				genner=genner,
-				db=SQLiteDB(
-					db_path=os.getenv("SQLITE_PATH", "../db/superior-agents.db")
-				),
-				rag=rag_client,
-				sensor=sensor,
-				txn_service_url=os.getenv("TXN_SERVICE_URL"),
-			)
+		try:
+			if answers["agent_type"] == "marketing":
+				start_marketing_agent(
+					agent_type=answers["agent_type"],
+					session_id="default_marketing"
+					if answers["agent_type"] == "marketing"
+					else "default_trading",
+					agent_id="default_marketing"
+					if answers["agent_type"] == "marketing"
+					else "default_trading",
+					fe_data=fe_data,
+					genner=genner,
+					db=db,
+					rag=rag_client,
+					sensor=sensor,
+				)
+			elif answers["agent_type"] == "trading":
+				start_trading_agent(
+					agent_type=answers["agent_type"],
+					session_id="default_marketing"
+					if answers["agent_type"] == "marketing"
+					else "default_trading",
+					agent_id="default_marketing"
+					if answers["agent_type"] == "marketing"
+					else "default_trading",
+					fe_data=fe_data,
+					genner=genner,
+					db=db,
+					rag=rag_client,
+					sensor=sensor,
+					txn_service_url=os.getenv("TXN_SERVICE_URL"),
+				)
+		except Exception:  # noqa: BLE001 - any cycle failure is logged and retried
+			# Retry transient upstream failures quickly, but back off (with jitter,
+			# capped) when they keep failing
+			delay = backoff + random.uniform(0, backoff * 0.1)
+			logger.exception(f"Cycle failed, retrying in {delay:.1f} seconds")
+			backoff = min(MAX_FAILURE_BACKOFF, backoff * 2)
+			time.sleep(delay)
+			continue
+
+		backoff = 1.0
 		session_interval = 15
 		logger.info(
 			f"Waiting for {session_interval} seconds before starting a new cycle..."
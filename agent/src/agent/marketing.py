@@ -13,6 +13,10 @@ from src.sensor.marketing import MarketingSensor
 from src.types import ChatHistory, Message
 
 
+# Matches prompt placeholders such as {metric_name}, capturing the name
+PLACEHOLDER_PATTERN = re.compile(r"{([^}]+)}")
+
+
 class MarketingPromptGenerator:
 	def __init__(self, prompts: Optional[Dict[str, str]] = None):
 		"""
@@ -28,10 +32,9 @@ class MarketingPromptGenerator:
 
 	def _extract_default_placeholders(self) -> Dict[str, Set[str]]:
 		"""Extract placeholders from default prompts to use as required placeholders."""
-		placeholder_pattern = re.compile(r"{([^}]+)}")
 		return {
 			prompt_name: {
-				f"{{{p}}}" for p in placeholder_pattern.findall(prompt_content)
+				f"{{{p}}}" for p in PLACEHOLDER_PATTERN.findall(prompt_content)
 			}
 			for prompt_name, prompt_content in self.get_default_prompts().items()
 		}
@@ -53,16 +56,13 @@ class MarketingPromptGenerator:
 		if missing_prompts:
 			raise ValueError(f"Missing required prompts: {missing_prompts}")
 
-		# Extract placeholders using regex
-		placeholder_pattern = re.compile(r"{([^}]+)}")
-
 		# Check each prompt for missing and unexpected placeholders
 		for prompt_name, prompt_content in prompts.items():
 			if prompt_name not in required_placeholders:
 				continue
 
 			actual_placeholders = {
-				f"{{{p}}}" for p in placeholder_pattern.findall(prompt_content)
+				f"{{{p}}}" for p in PLACEHOLDER_PATTERN.findall(prompt_content)
 			}
 			required_set = required_placeholders[prompt_name]
 
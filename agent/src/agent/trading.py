@@ -13,6 +13,10 @@ from src.sensor.trading import TradingSensor
 from src.types import ChatHistory, Message
 
 
+# Matches prompt placeholders such as {metric_name}, capturing the name
+PLACEHOLDER_PATTERN = re.compile(r"{([^}]+)}")
+
+
 class TradingPromptGenerator:
 	"""
 	Generator for creating prompts used in trading agent workflows.
@@ -175,10 +179,9 @@ class TradingPromptGenerator:
 		Returns:
 		        Dict[str, Set[str]]: Dictionary mapping prompt names to sets of placeholders
 		"""
-		placeholder_pattern = re.compile(r"{([^}]+)}")
 		return {
 			prompt_name: {
-				f"{{{p}}}" for p in placeholder_pattern.findall(prompt_content)
+				f"{{{p}}}" for p in PLACEHOLDER_PATTERN.findall(prompt_content)
 			}
 			for prompt_name, prompt_content in self.get_default_prompts().items()
 		}
@@ -204,9 +207,6 @@ class TradingPromptGenerator:
 		if missing_prompts:
 			raise ValueError(f"Missing required prompts: {missing_prompts}")
 
-		# Extract placeholders using regex
-		placeholder_pattern = re.compile(r"{([^}]+)}")
-
 		# Check each prompt for missing and unexpected placeholders
 		for prompt_name, prompt_content in prompts.items():
 			if prompt_name not in required_placeholders:
@@ -214,7 +214,7 @@ class TradingPromptGenerator:
 
 			# Get actual placeholders in the prompt
 			actual_placeholders = {
-				f"{{{p}}}" for p in placeholder_pattern.findall(prompt_content)
+				f"{{{p}}}" for p in PLACEHOLDER_PATTERN.findall(prompt_content)
 			}
 			required_set = required_placeholders[prompt_name]
 
@@ -4,9 +4,12 @@ from pprint import pprint
 from loguru import logger
 import requests
 from src.datatypes import StrategyData
+from src.helper import dumps_json, get_http_session
 from typing import List, Tuple, TypedDict, Any
 import dataclasses
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class RAGInsertData(TypedDict):
 	"""
@@ -121,6 +124,7 @@ class RAGClient:
 		self.base_url = base_url
 		self.agent_id = agent_id
 		self.session_id = session_id
+		self.http_session = get_http_session()
 
 	def save_result_batch(self, batch_data: List[StrategyData]) -> requests.Response:
 		"""
@@ -146,12 +150,12 @@ class RAGClient:
 
 		for data in batch_data:
 			if isinstance(data.created_at, datetime):
-				data.created_at = data.created_at.isoformat()
+				data = dataclasses.replace(data, created_at=data.created_at.isoformat())
 
 			payload.append(
 				{
 					"strategy": data.summarized_desc,
-					"strategy_data": json.dumps(dataclasses.asdict(data)),
+					"strategy_data": dumps_json(dataclasses.asdict(data)).decode(),
 					"reference_id": data.strategy_id,
 					"agent_id": self.agent_id,
 					"session_id": self.session_id,
@@ -159,7 +163,9 @@ class RAGClient:
 				}
 			)
 
-		response = requests.post(url, json=payload)
+		response = self.http_session.post(
+			url, data=dumps_json(payload), headers=JSON_HEADERS
+		)
 		response.raise_for_status()
 
 		r = response.json()
@@ -200,7 +206,7 @@ class RAGClient:
 
 		for data in batch_data:
 			if isinstance(data.created_at, datetime):
-				data.created_at = data.created_at.isoformat()
+				data = dataclasses.replace(data, created_at=data.created_at.isoformat())
 
 			if isinstance(data.parameters, str):
 				parsed_once = json.loads(data.parameters)
@@ -219,7 +225,7 @@ class RAGClient:
 			payload.append(
 				{
 					"notification_key": data_params["notif_str"],
-					"strategy_data": json.dumps(dataclasses.asdict(data)),
+					"strategy_data": dumps_json(dataclasses.asdict(data)).decode(),
 					"reference_id": data.strategy_id,
 					"agent_id": self.agent_id,
 					"session_id": self.session_id,
@@ -232,7 +238,9 @@ class RAGClient:
 				f"{missing_keys} StrategyData(s) with missing 'notif_str' keys are found, those are being skipped..."
 			)
 
-		response = requests.post(url, json=payload)
+		response = self.http_session.post(
+			url, data=dumps_json(payload), headers=JSON_HEADERS
+		)
 		response.raise_for_status()
 
 		r = response.json()
@@ -270,7 +278,9 @@ class RAGClient:
 			"threshold": 0.7,
 		}
 
-		response = requests.post(url, json=payload)
+		response = self.http_session.post(
+			url, data=dumps_json(payload), headers=JSON_HEADERS
+		)
 		response.raise_for_status()
 
 		r: StrategyResponse = response.json()
@@ -317,7 +327,9 @@ class RAGClient:
 			"top_k": 1,
 		}
 
-		response = requests.post(url, json=payload)
+		response = self.http_session.post(
+			url, data=dumps_json(payload), headers=JSON_HEADERS
+		)
 
 		try:
 			response.raise_for_status()
@@ -379,7 +391,9 @@ class RAGClient:
 			"top_k": 1,
 		}
 
-		response = requests.post(url, json=payload)
+		response = self.http_session.post(
+			url, data=dumps_json(payload), headers=JSON_HEADERS
+		)
 
 		try:
 			response.raise_for_status()
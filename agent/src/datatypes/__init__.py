@@ -31,7 +31,7 @@ class WalletStats(TypedDict):
 	timestamp: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NotificationData:
 	"""
 	Data class representing a notification received by the agent.
@@ -93,7 +93,7 @@ class StrategyDataParameters(TypedDict):
 	notif_str: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StrategyData:
 	"""
 	Data class representing a complete trading strategy.
@@ -119,7 +119,7 @@ class StrategyData:
 	created_at: datetime | str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StrategyInsertData:
 	"""
 	Data class for inserting a new strategy into the system.
@@ -4,7 +4,7 @@ from typing import Optional
 from enum import Enum
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsData:
 	date: datetime
 	title: str
@@ -77,12 +77,12 @@ class MarketingAgentState(Enum):
 		Check if the state represents a successful outcome.
 
 		This property method determines if the current state is a success state
-		by checking if the state name starts with "SUCCESS".
+		by checking membership in the precomputed set of "SUCCESS" states.
 
 		Returns:
 		    bool: True if the state is a success state, False otherwise
 		"""
-		return self.name.startswith("SUCCESS")
+		return self in _SUCCESS_STATES
 
 	@property
 	def is_failure(self) -> bool:
@@ -90,9 +90,18 @@ class MarketingAgentState(Enum):
 		Check if the state represents a failed outcome.
 
 		This property method determines if the current state is a failure state
-		by checking if the state name starts with "FAILED".
+		by checking membership in the precomputed set of "FAILED" states.
 
 		Returns:
 		    bool: True if the state is a failure state, False otherwise
 		"""
-		return self.name.startswith("FAILED")
+		return self in _FAILURE_STATES
+
+
+# Built once from the member names, so the properties are a set lookup
+_SUCCESS_STATES = frozenset(
+	state for state in MarketingAgentState if state.name.startswith("SUCCESS")
+)
+_FAILURE_STATES = frozenset(
+	state for state in MarketingAgentState if state.name.startswith("FAILED")
+)
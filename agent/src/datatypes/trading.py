@@ -1,9 +1,9 @@
 from decimal import Decimal
-from typing import List, TypedDict
+from typing import Any, Dict, List, NamedTuple
 from enum import Enum
 
 
-class TokenBalance(TypedDict):
+class TokenBalance(NamedTuple):
 	"""
 	Type definition for a token balance in a crypto portfolio.
 
@@ -30,8 +30,17 @@ class TokenBalance(TypedDict):
 	value_usd: float
 	change_24h: float
 
+	@classmethod
+	def from_dict(cls, data: Dict[str, Any]) -> "TokenBalance":
+		"""Build a TokenBalance from its JSON/dict form."""
+		return cls(**{field: data[field] for field in cls._fields})
 
-class PortfolioStatus(TypedDict):
+	def as_dict(self) -> Dict[str, Any]:
+		"""Convert back to the JSON/dict form."""
+		return self._asdict()
+
+
+class PortfolioStatus(NamedTuple):
 	"""
 	Type definition for the overall status of a crypto portfolio.
 
@@ -52,6 +61,21 @@ class PortfolioStatus(TypedDict):
 	token_balances: List[TokenBalance]
 	timestamp: int
 
+	@classmethod
+	def from_dict(cls, data: Dict[str, Any]) -> "PortfolioStatus":
+		"""Build a PortfolioStatus (and its token balances) from its JSON/dict form."""
+		fields = {field: data[field] for field in cls._fields}
+		fields["token_balances"] = [
+			TokenBalance.from_dict(balance) for balance in data["token_balances"]
+		]
+		return cls(**fields)
+
+	def as_dict(self) -> Dict[str, Any]:
+		"""Convert back to the JSON/dict form, including the token balances."""
+		data = self._asdict()
+		data["token_balances"] = [balance.as_dict() for balance in self.token_balances]
+		return data
+
 
 class TradingAgentState(Enum):
 	"""
@@ -66,7 +66,9 @@ create table if not exists sup_notifications (
     created DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
-create index if not exists sup_notifications_source_IDX on sup_notifications (source);
+-- (source, created) serves both the source filter and the newest-first ordering
+drop index if exists sup_notifications_source_IDX;
+create index if not exists idx_source_created on sup_notifications (source, created);
 
 create table if not exists sup_payments (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -141,6 +143,8 @@ create table if not exists sup_wallet_snapshots (
 );
 
 create index if not exists idx_agent_time on sup_wallet_snapshots (agent_id, snapshot_time);
+-- find_wallet_snapshot probes by time alone (the wallet is only encoded in snapshot_id)
+create index if not exists idx_snapshot_time on sup_wallet_snapshots (snapshot_time);
 
 create table if not exists sup_token_price (
   data_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -152,3 +156,5 @@ create table if not exists sup_token_price (
   UNIQUE(token_addr)
 );
 
+create index if not exists idx_token_price_symbol on sup_token_price (symbol);
+
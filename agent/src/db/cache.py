@@ -0,0 +1,98 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+	"""
+	Thread-safe LRU cache whose entries also expire after a fixed time-to-live.
+
+	Used by the API-backed database client to avoid re-fetching data that is
+	read every cycle but changes rarely.
+	"""
+
+	def __init__(self, maxsize: int = 128, ttl: float = 30.0):
+		"""
+		Initialize the cache.
+
+		Args:
+			maxsize (int): Maximum number of entries kept before the least recently used is evicted
+			ttl (float): Seconds an entry stays valid after it was stored
+		"""
+		self.maxsize = maxsize
+		self.ttl = ttl
+		self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+		self._lock = threading.Lock()
+		self._hits = 0
+		self._misses = 0
+		self._evictions = 0
+
+	def get(self, key: Hashable) -> Tuple[bool, Optional[Any]]:
+		"""
+		Look up a key.
+
+		Args:
+			key (Hashable): The cache key
+
+		Returns:
+			Tuple[bool, Optional[Any]]: (True, value) on a fresh hit, (False, None) otherwise
+		"""
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None:
+				self._misses += 1
+				return False, None
+
+			expires_at, value = entry
+			if expires_at <= time.monotonic():
+				del self._entries[key]
+				self._misses += 1
+				return False, None
+
+			self._entries.move_to_end(key)
+			self._hits += 1
+			return True, value
+
+	def put(self, key: Hashable, value: Any) -> None:
+		"""
+		Store a value, evicting the least recently used entry if the cache is full.
+
+		Args:
+			key (Hashable): The cache key
+			value (Any): The value to store
+		"""
+		with self._lock:
+			self._entries[key] = (time.monotonic() + self.ttl, value)
+			self._entries.move_to_end(key)
+			while len(self._entries) > self.maxsize:
+				self._entries.popitem(last=False)
+				self._evictions += 1
+
+	def invalidate(self, key: Optional[Hashable] = None) -> None:
+		"""
+		Drop one entry, or every entry when no key is given.
+
+		Args:
+			key (Optional[Hashable]): The cache key to drop
+		"""
+		with self._lock:
+			if key is None:
+				self._entries.clear()
+			else:
+				self._entries.pop(key, None)
+
+	def stats(self) -> Dict[str, int]:
+		"""
+		Get hit/miss/eviction counters for observability.
+
+		Returns:
+			Dict[str, int]: Counters and the current number of entries
+		"""
+		with self._lock:
+			return {
+				"hits": self._hits,
+				"misses": self._misses,
+				"evictions": self._evictions,
+				"size": len(self._entries),
+			}
@@ -7,9 +7,14 @@ import json
 from datetime import datetime, timedelta
 
 from src.datatypes import StrategyData, StrategyInsertData
+from src.db.cache import TTLCache
 from src.db.interface import DBInterface
 from src.types import ChatHistory
-from src.helper import get_latest_notifications_by_source
+from src.helper import (
+	dumps_json,
+	get_http_session,
+	get_latest_notifications_by_source,
+)
 import random
 
 T = TypeVar("T")
@@ -62,6 +67,11 @@ class APIDB(DBInterface[T]):
 		"""
 		self.base_url = base_url
 		self.headers = {"x-api-key": api_key, "Content-Type": "application/json"}
+		self.http_session = get_http_session()
+		# The latest strategy is polled every cycle, the full list once per agent
+		# start; both only change when this client inserts a strategy
+		self._latest_strategy_cache = TTLCache(maxsize=64, ttl=30)
+		self._all_strategies_cache = TTLCache(maxsize=64, ttl=300)
 
 	def _make_request(
 		self, endpoint: str, data: Dict[str, Any], response_type: type[T]
@@ -81,8 +91,10 @@ class APIDB(DBInterface[T]):
 			ApiResponse[T]: Response object containing success status, data, and error info
 		"""
 		try:
-			response = requests.post(
-				f"{self.base_url}/{endpoint}", headers=self.headers, json=data
+			response = self.http_session.post(
+				f"{self.base_url}/{endpoint}",
+				headers=self.headers,
+				data=dumps_json(data),
 			)
 			response.raise_for_status()
 			return ApiResponse(success=True, data=cast(T, response.json()), error=None)
@@ -104,7 +116,9 @@ class APIDB(DBInterface[T]):
 			ApiResponse[T]: Response object containing success status, data, and error info
 		"""
 		try:
-			response = requests.get(f"{self.base_url}/{endpoint}", headers=self.headers)
+			response = self.http_session.get(
+				f"{self.base_url}/{endpoint}", headers=self.headers
+			)
 			response.raise_for_status()
 			return ApiResponse(success=True, data=cast(T, response.json()), error=None)
 		except requests.exceptions.RequestException as e:
@@ -196,7 +210,9 @@ class APIDB(DBInterface[T]):
 			strategy_data["full_desc"] = strategy_result.full_desc
 
 		if strategy_result.parameters is not None:
-			strategy_data["parameters"] = json.dumps(strategy_result.parameters)
+			strategy_data["parameters"] = dumps_json(
+				strategy_result.parameters
+			).decode()
 
 		if strategy_result.strategy_result is not None:
 			strategy_data["strategy_result"] = strategy_result.strategy_result
@@ -208,6 +224,8 @@ class APIDB(DBInterface[T]):
 		if not response.success:
 			raise ApiError(f"Failed to insert strategy: {response.error}")
 
+		self._latest_strategy_cache.invalidate(agent_id)
+		self._all_strategies_cache.invalidate(agent_id)
 		return True
 
 	def fetch_latest_strategy(self, agent_id: str) -> Optional[StrategyData]:
@@ -225,6 +243,10 @@ class APIDB(DBInterface[T]):
 		Raises:
 			ApiError: If the strategy fetching fails
 		"""
+		hit, cached = self._latest_strategy_cache.get(agent_id)
+		if hit:
+			return cached
+
 		strategies_response = self._make_request(
 			"strategies/get_2",
 			{},
@@ -238,11 +260,12 @@ class APIDB(DBInterface[T]):
 		agent_strategies = [s for s in strategies if s.get("agent_id") == agent_id]
 
 		if not agent_strategies:
+			self._latest_strategy_cache.put(agent_id, None)
 			return None
 
 		latest = max(agent_strategies, key=lambda s: s.get("strategy_id", ""))
 
-		return StrategyData(
+		strategy = StrategyData(
 			strategy_id=str(latest["strategy_id"]),
 			agent_id=agent_id,
 			parameters=json.loads(latest["parameters"]),
@@ -251,6 +274,8 @@ class APIDB(DBInterface[T]):
 			full_desc=str(latest["full_desc"]),
 			created_at=str(latest["created_at"]),
 		)
+		self._latest_strategy_cache.put(agent_id, strategy)
+		return strategy
 
 	def fetch_all_strategies(self, agent_id: str) -> List[StrategyData]:
 		"""
@@ -268,6 +293,10 @@ class APIDB(DBInterface[T]):
 		Raises:
 			ApiError: If the strategy fetching fails
 		"""
+		hit, cached = self._all_strategies_cache.get(agent_id)
+		if hit:
+			return list(cached)
+
 		strategies_response = self._make_request(
 			"strategies/get",
 			{},
@@ -292,7 +321,8 @@ class APIDB(DBInterface[T]):
 			if strat.get("agent_id") == agent_id
 		]
 
-		return agent_strategies
+		self._all_strategies_cache.put(agent_id, agent_strategies)
+		return list(agent_strategies)
 
 	def insert_chat_history(
 		self,
@@ -344,7 +374,7 @@ class APIDB(DBInterface[T]):
 
 			# Add metadata if it exists
 			if message.metadata:
-				chat_data["metadata"] = json.dumps(message.metadata)
+				chat_data["metadata"] = dumps_json(message.metadata).decode()
 
 			# Make API request to create chat history entry
 			response = self._make_request(
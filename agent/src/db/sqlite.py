@@ -1,12 +1,15 @@
 import json
 import sqlite3
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Iterator, Optional, List
 from dataclasses import dataclass
 from src.datatypes import StrategyData, StrategyInsertData
 from src.db.interface import DBInterface
 from src.types import ChatHistory
 import uuid
+from bisect import bisect_left
 
 
 @dataclass
@@ -18,6 +21,40 @@ class TokenPriceData:
 	metadata: str
 
 
+# Applied to every connection; mmap lets reads go through the OS page cache
+# instead of copying pages into SQLite's own buffer
+CONNECTION_PRAGMAS = (
+	"PRAGMA mmap_size = 268435456;"  # 256 MiB
+	"PRAGMA temp_store = MEMORY;"
+	"PRAGMA cache_size = -65536;"  # 64 MiB
+)
+
+# How far a stored snapshot may drift from the requested time and still count
+# as "the snapshot at that time"
+SNAPSHOT_MATCH_TOLERANCE = timedelta(hours=1)
+
+
+def _to_snapshot_time(dt: datetime) -> str:
+	"""Format a datetime the way `snapshot_time` is stored (naive UTC, second precision)."""
+	if dt.tzinfo is not None:
+		dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+	return dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _nearest_index(
+	times: List[datetime], target: datetime, tolerance: timedelta
+) -> Optional[int]:
+	"""Binary-search sorted `times` for the entry closest to `target` within `tolerance`."""
+	idx = bisect_left(times, target)
+	best = None
+	for i in (idx - 1, idx):
+		if 0 <= i < len(times):
+			gap = abs(times[i] - target)
+			if gap <= tolerance and (best is None or gap < abs(times[best] - target)):
+				best = i
+	return best
+
+
 class SQLiteDB(DBInterface):
 	def __init__(self, db_path: str):
 		"""Initialize SQLite database connection and create tables if they don't exist.
@@ -26,6 +63,10 @@ class SQLiteDB(DBInterface):
 		    db_path (str): Path to the SQLite database file
 		"""
 		self.db_path = db_path
+		# One connection per instance, opened on first use and shared by every
+		# helper; the lock serialises access since it is shared across threads
+		self._conn: Optional[sqlite3.Connection] = None
+		self._conn_lock = threading.RLock()
 		self._init_db()
 
 	def _init_db(self):
@@ -37,14 +78,41 @@ class SQLiteDB(DBInterface):
 		with open("src/db/00002_seed.sql", "r") as f:
 			seed_script = f.read()
 
-		with sqlite3.connect(self.db_path) as conn:
+		with self._connect() as conn:
 			cursor = conn.cursor()
+			# WAL is persistent, so it only has to be switched on once per database file
+			cursor.execute("PRAGMA journal_mode = WAL")
 			cursor.executescript(init_script)
 			cursor.executescript(seed_script)
 			conn.commit()
 
+	@contextmanager
+	def _connect(self) -> Iterator[sqlite3.Connection]:
+		"""Borrow the cached connection, committing on success and rolling back on error.
+
+		The connection is opened lazily with the read-tuning pragmas applied and
+		then reused for the lifetime of this instance.
+
+		Yields:
+		    sqlite3.Connection: The shared connection to `self.db_path`
+		"""
+		with self._conn_lock:
+			if self._conn is None:
+				conn = sqlite3.connect(self.db_path, check_same_thread=False)
+				conn.executescript(CONNECTION_PRAGMAS)
+				self._conn = conn
+			with self._conn:
+				yield self._conn
+
+	def close(self):
+		"""Close the cached connection; the next query will open a new one."""
+		with self._conn_lock:
+			if self._conn is not None:
+				self._conn.close()
+				self._conn = None
+
 	def fetch_params_using_agent_id(self, agent_id: str) -> Dict[str, Dict[str, Any]]:
-		with sqlite3.connect(self.db_path) as conn:
+		with self._connect() as conn:
 			cursor = conn.cursor()
 			cursor.execute(
 				"SELECT strategy_id, parameters, summarized_desc, full_desc FROM sup_strategies WHERE agent_id = ?",
@@ -66,7 +134,7 @@ class SQLiteDB(DBInterface):
 		self, agent_id: str, strategy_result: StrategyInsertData
 	) -> bool:
 		try:
-			with sqlite3.connect(self.db_path) as conn:
+			with self._connect() as conn:
 				cursor = conn.cursor()
 				cursor.execute(
 					"""INSERT INTO sup_strategies (strategy_id, agent_id, parameters, summarized_desc, full_desc)
@@ -86,7 +154,7 @@ class SQLiteDB(DBInterface):
 			return False
 
 	def fetch_latest_strategy(self, agent_id: str) -> Optional[StrategyData]:
-		with sqlite3.connect(self.db_path) as conn:
+		with self._connect() as conn:
 			cursor = conn.cursor()
 			cursor.execute(
 				"""SELECT strategy_id, parameters, summarized_desc, full_desc, strategy_result, created_at 
@@ -111,7 +179,7 @@ class SQLiteDB(DBInterface):
 			return None
 
 	def fetch_all_strategies(self, agent_id: str) -> List[StrategyData]:
-		with sqlite3.connect(self.db_path) as conn:
+		with self._connect() as conn:
 			cursor = conn.cursor()
 			cursor.execute(
 				"""SELECT strategy_id, parameters, summarized_desc, full_desc, strategy_result, created_at 
@@ -142,7 +210,7 @@ class SQLiteDB(DBInterface):
 		base_timestamp: Optional[str] = None,
 	) -> bool:
 		try:
-			with sqlite3.connect(self.db_path) as conn:
+			with self._connect() as conn:
 				cursor = conn.cursor()
 				for message in chat_history.messages:
 					timestamp = base_timestamp or datetime.now().strftime(
@@ -157,7 +225,7 @@ class SQLiteDB(DBInterface):
 			return False
 
 	def fetch_latest_notification_str(self, sources: List[str]) -> str:
-		with sqlite3.connect(self.db_path) as conn:
+		with self._connect() as conn:
 			cursor = conn.cursor()
 			placeholders = ",".join(["?" for _ in sources])
 			cursor.execute(
@@ -173,25 +241,40 @@ class SQLiteDB(DBInterface):
 	def fetch_latest_notification_str_v2(
 		self, sources: List[str], limit: int = 1
 	) -> str:
-		with sqlite3.connect(self.db_path) as conn:
+		if not sources:
+			return ""
+
+		with self._connect() as conn:
 			cursor = conn.cursor()
-			results = []
-			for source in sources:
-				cursor.execute(
-					"""SELECT long_desc 
-                       FROM sup_notifications 
-                       WHERE source = ? 
-                       ORDER BY created DESC 
-                       LIMIT ?""",
-					(source, limit),
-				)
-				rows = cursor.fetchall()
-				results.extend(row[0] for row in rows)
-			return "\n".join(results)
+			placeholders = ",".join(["?" for _ in sources])
+			# One round-trip for every source: rank rows per source and keep the newest `limit`
+			cursor.execute(
+				f"""SELECT source, long_desc
+                   FROM (
+                       SELECT source, long_desc, created,
+                              ROW_NUMBER() OVER (PARTITION BY source ORDER BY created DESC) AS rn
+                       FROM sup_notifications
+                       WHERE source IN ({placeholders})
+                   )
+                   WHERE rn <= ?
+                   ORDER BY source, created DESC""",
+				(*sources, limit),
+			)
+			by_source: Dict[str, List[str]] = {}
+			for source, long_desc in cursor.fetchall():
+				by_source.setdefault(source, []).append(long_desc)
+
+			return "\n".join(
+				long_desc
+				for source in sources
+				for long_desc in by_source.get(source, [])
+			)
 
 	def get_agent_session(self, session_id: str) -> Optional[Dict[str, Any]]:
-		with sqlite3.connect(self.db_path) as conn:
+		with self._connect() as conn:
 			cursor = conn.cursor()
+			# Column names become the dict keys, so the select list is the schema
+			cursor.row_factory = sqlite3.Row
 			cursor.execute(
 				"""SELECT agent_id, started_at, status, cycle_count, fe_data, will_end_at 
                    FROM sup_agent_sessions 
@@ -200,20 +283,11 @@ class SQLiteDB(DBInterface):
 			)
 			row = cursor.fetchone()
 
-			if row:
-				return {
-					"agent_id": row[0],
-					"started_at": row[1],
-					"status": row[2],
-					"cycle_count": row[3],
-					"fe_data": row[4],
-					"will_end_at": row[5],
-				}
-			return None
+			return dict(row) if row else None
 
 	def update_agent_session(self, session_id: str, agent_id: str, status: str) -> bool:
 		try:
-			with sqlite3.connect(self.db_path) as conn:
+			with self._connect() as conn:
 				cursor = conn.cursor()
 				cursor.execute(
 					"""UPDATE sup_agent_sessions 
@@ -227,7 +301,7 @@ class SQLiteDB(DBInterface):
 
 	def add_cycle_count(self, session_id: str, agent_id: str) -> bool:
 		try:
-			with sqlite3.connect(self.db_path) as conn:
+			with self._connect() as conn:
 				cursor = conn.cursor()
 				cursor.execute(
 					"""UPDATE sup_agent_sessions 
@@ -243,7 +317,7 @@ class SQLiteDB(DBInterface):
 		self, session_id: str, agent_id: str, started_at: str, status: str
 	) -> bool:
 		try:
-			with sqlite3.connect(self.db_path) as conn:
+			with self._connect() as conn:
 				cursor = conn.cursor()
 				cursor.execute(
 					"""INSERT INTO sup_agent_sessions (session_id, agent_id, started_at, status)
@@ -262,7 +336,7 @@ class SQLiteDB(DBInterface):
 		refresh_token: str,
 	) -> bool:
 		try:
-			with sqlite3.connect(self.db_path) as conn:
+			with self._connect() as conn:
 				cursor = conn.cursor()
 				cursor.execute(
 					"""INSERT OR REPLACE INTO sup_twitter_token 
@@ -282,7 +356,7 @@ class SQLiteDB(DBInterface):
 		refresh_token: str,
 	) -> bool:
 		try:
-			with sqlite3.connect(self.db_path) as conn:
+			with self._connect() as conn:
 				cursor = conn.cursor()
 				cursor.execute(
 					"""UPDATE sup_twitter_token 
@@ -297,8 +371,9 @@ class SQLiteDB(DBInterface):
 	def get_twitter_token(
 		self, agent_id: str, access_token: str, refresh_token: str
 	) -> Optional[Dict[str, Any]]:
-		with sqlite3.connect(self.db_path) as conn:
+		with self._connect() as conn:
 			cursor = conn.cursor()
+			cursor.row_factory = sqlite3.Row
 			cursor.execute(
 				"""SELECT agent_id, last_refreshed_at, access_token, refresh_token 
                    FROM sup_twitter_token 
@@ -307,20 +382,13 @@ class SQLiteDB(DBInterface):
 			)
 			row = cursor.fetchone()
 
-			if row:
-				return {
-					"agent_id": row[0],
-					"last_refreshed_at": row[1],
-					"access_token": row[2],
-					"refresh_token": row[3],
-				}
-			return None
+			return dict(row) if row else None
 
 	def insert_wallet_snapshot(
 		self, snapshot_id: str, agent_id: str, total_value_usd: float, assets: str
 	) -> bool:
 		try:
-			with sqlite3.connect(self.db_path) as conn:
+			with self._connect() as conn:
 				cursor = conn.cursor()
 				cursor.execute(
 					"""INSERT INTO sup_wallet_snapshots (snapshot_id, agent_id, total_value_usd, assets)
@@ -334,8 +402,40 @@ class SQLiteDB(DBInterface):
 	def find_wallet_snapshot(
 		self, wallet_address: str, target_time: datetime
 	) -> Dict | None:
-		# TODO: Make this actually work
-		return None
+		target = datetime.fromisoformat(_to_snapshot_time(target_time))
+		lower = _to_snapshot_time(target - SNAPSHOT_MATCH_TOLERANCE)
+		upper = _to_snapshot_time(target + SNAPSHOT_MATCH_TOLERANCE)
+		target_str = _to_snapshot_time(target)
+		# Snapshot ids end in "-<wallet_address>"; the nearest row is one of the two
+		# neighbours of the target, so probe each side of the snapshot_time index
+		# instead of scoring every row in the window
+		wallet_filter = "snapshot_id LIKE '%-' || ?"
+		with self._connect() as conn:
+			cursor = conn.cursor()
+			cursor.row_factory = sqlite3.Row
+			cursor.execute(
+				f"""SELECT * FROM sup_wallet_snapshots
+				WHERE {wallet_filter} AND snapshot_time BETWEEN ? AND ?
+				ORDER BY snapshot_time DESC LIMIT 1""",
+				(wallet_address, lower, target_str),
+			)
+			before = cursor.fetchone()
+			cursor.execute(
+				f"""SELECT * FROM sup_wallet_snapshots
+				WHERE {wallet_filter} AND snapshot_time BETWEEN ? AND ?
+				ORDER BY snapshot_time ASC LIMIT 1""",
+				(wallet_address, target_str, upper),
+			)
+			after = cursor.fetchone()
+
+		candidates = [row for row in (before, after) if row is not None]
+		if not candidates:
+			return None
+		nearest = min(
+			candidates,
+			key=lambda row: abs(datetime.fromisoformat(row["snapshot_time"]) - target),
+		)
+		return dict(nearest)
 
 	def get_historical_wallet_values(
 		self,
@@ -344,11 +444,39 @@ class SQLiteDB(DBInterface):
 		agent_id: str,
 		intervals: Dict[str, timedelta],
 	) -> Dict[str, float | None]:
-		# TODO: Make this actually work
-		return {}
+		targets = {
+			f"wallet_value_{interval_name}": datetime.fromisoformat(
+				_to_snapshot_time(current_time - delta)
+			)
+			for interval_name, delta in intervals.items()
+		}
+		if not targets:
+			return {}
+
+		# One range scan over (agent_id, snapshot_time) covering every interval,
+		# then match each target in memory instead of querying per interval
+		lower = min(targets.values()) - SNAPSHOT_MATCH_TOLERANCE
+		upper = max(targets.values()) + SNAPSHOT_MATCH_TOLERANCE
+		with self._connect() as conn:
+			cursor = conn.cursor()
+			cursor.execute(
+				"""SELECT snapshot_time, total_value_usd
+				FROM sup_wallet_snapshots
+				WHERE agent_id = ? AND snapshot_time BETWEEN ? AND ?
+				ORDER BY snapshot_time""",
+				(agent_id, _to_snapshot_time(lower), _to_snapshot_time(upper)),
+			)
+			rows = cursor.fetchall()
+
+		times = [datetime.fromisoformat(row[0]) for row in rows]
+		historical_values: Dict[str, float | None] = {}
+		for key, target in targets.items():
+			idx = _nearest_index(times, target, SNAPSHOT_MATCH_TOLERANCE)
+			historical_values[key] = rows[idx][1] if idx is not None else None
+		return historical_values
 
 	def get_agent_profile_image(self, agent_id: str) -> Optional[str]:
-		with sqlite3.connect(self.db_path) as conn:
+		with self._connect() as conn:
 			cursor = conn.cursor()
 			cursor.execute(
 				"""SELECT profile_image 
@@ -366,8 +494,9 @@ class SQLiteDB(DBInterface):
 		return self.get_token_price("ETH")
 
 	def get_token_price(self, symbol: str) -> Optional[TokenPriceData]:
-		with sqlite3.connect(self.db_path) as conn:
+		with self._connect() as conn:
 			cursor = conn.cursor()
+			cursor.row_factory = sqlite3.Row
 			cursor.execute(
 				"""SELECT token_addr, symbol, price, last_updated_at, metadata 
 				FROM sup_token_price 
@@ -376,19 +505,11 @@ class SQLiteDB(DBInterface):
 			)
 			row = cursor.fetchone()
 
-			if row:
-				return TokenPriceData(
-					token_addr=row[0],
-					symbol=row[1],
-					price=row[2],
-					last_updated_at=row[3],
-					metadata=row[4],
-				)
-			return None
+			return TokenPriceData(**dict(row)) if row else None
 
 	def insert_token_price(self, token_addr, symbol, price, metadata=""):
 		try:
-			with sqlite3.connect(self.db_path) as conn:
+			with self._connect() as conn:
 				cursor = conn.cursor()
 				cursor.execute(
 					"""INSERT INTO sup_token_price (token_addr, symbol, price, last_updated_at, metadata)
@@ -401,7 +522,7 @@ class SQLiteDB(DBInterface):
 
 	def update_token_price(self, token_addr, symbol, price, metadata) -> bool:
 		try:
-			with sqlite3.connect(self.db_path) as conn:
+			with self._connect() as conn:
 				cursor = conn.cursor()
 				cursor.execute(
 					"""UPDATE sup_token_price 
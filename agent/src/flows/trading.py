@@ -438,7 +438,7 @@ def assisted_flow(
 	agent.db.insert_wallet_snapshot(
 		snapshot_id=f"{nanoid(8)}-{session_id}-{start_metric_state['wallet_address']}",
 		agent_id=agent.agent_id,
-		total_value_usd=start_metric_state["total_value_usd"],
+		total_value_usd=end_metric_state["total_value_usd"],
 		assets=json.dumps(end_metric_state),
 	)
 
@@ -1,13 +1,24 @@
+import atexit
 from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+import json
 import os
 import signal
+import sys
+import threading
+import time
 import re
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, TextIO, Tuple
 from src.constants import SERVICE_TO_PROMPT, SERVICE_TO_ENV
 import string
 import random
+import weakref
 import httpx
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 @contextmanager
@@ -96,9 +107,14 @@ def services_to_prompts(services: List[str]) -> List[str]:
 	    >>> services_to_prompts(["Twitter", "CoinGecko"])
 	    ['Twitter (using tweepy, env vars TWITTER_API_KEY, ...)', 'CoinGecko (env vars COINGECKO_API_KEY) ...']
 	"""
+	return list(_services_to_prompts(tuple(services)))
+
+
+@lru_cache(maxsize=64)
+def _services_to_prompts(services: Tuple[str, ...]) -> Tuple[str, ...]:
 	service_to_prompt = SERVICE_TO_PROMPT
 
-	return [service_to_prompt[service] for service in services]
+	return tuple(service_to_prompt[service] for service in services)
 
 
 def services_to_envs(platforms: List[str]) -> Dict[str, str]:
@@ -122,21 +138,28 @@ def services_to_envs(platforms: List[str]) -> Dict[str, str]:
 	    >>> services_to_envs(["Twitter", "CoinGecko"])
 	    {'TWITTER_API_KEY': 'key_value', 'TWITTER_API_KEY_SECRET': 'secret_value', ...}
 	"""
+	# Only the platform -> variable-name resolution is memoized; the values are
+	# read from the environment on every call so late-set variables are picked up
+	return {
+		env_var: os.getenv(env_var, "")
+		for env_var in _services_to_env_vars(tuple(platforms))
+	}
+
+
+@lru_cache(maxsize=64)
+def _services_to_env_vars(platforms: Tuple[str, ...]) -> Tuple[str, ...]:
 	env_var_mapping: Dict[str, List[str]] = SERVICE_TO_ENV
 
-	final_dict = {}
+	env_vars: Dict[str, None] = {}
 	for platform in platforms:
 		if platform not in env_var_mapping:
 			raise ValueError(
 				f"Unsupported platform: {platform}. Supported platforms: {', '.join(env_var_mapping.keys())}"
 			)
 
-		# Create dictionary of environment variables and their values
-		final_dict.update(
-			{env_var: os.getenv(env_var, "") for env_var in env_var_mapping[platform]}
-		)
+		env_vars.update(dict.fromkeys(env_var_mapping[platform]))
 
-	return final_dict
+	return tuple(env_vars)
 
 
 def get_latest_notifications_by_source(notifications: List[Dict]) -> List[Dict]:
@@ -232,3 +255,128 @@ async def get_ether_address_from_txn_service(agent_id: str) -> str:
 		if "evm" not in data or data["evm"] == "NOT IMPORTED/CREATED":
 			raise Exception("ETHER ADDRESS not imported/created")
 		return data["evm"]
+
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+	"""
+	Get the process-wide HTTP session shared by the API clients.
+
+	Connections are kept alive and pooled per host, so repeated calls to the
+	same service skip the TCP/TLS handshake. Failed connection attempts are
+	retried with backoff; requests that reached the server are not replayed.
+
+	Returns:
+	    requests.Session: The shared session
+	"""
+	adapter = HTTPAdapter(
+		pool_connections=16,
+		pool_maxsize=32,
+		max_retries=Retry(total=3, backoff_factor=0.3),
+	)
+	session = requests.Session()
+	session.mount("http://", adapter)
+	session.mount("https://", adapter)
+	return session
+
+
+def dumps_json(obj: Any) -> bytes:
+	"""
+	Serialize a payload to UTF-8 JSON bytes using orjson.
+
+	Falls back to the standard library encoder for values orjson rejects, such as
+	integers wider than 64 bits (raw token balances) or non-string dict keys.
+
+	Args:
+	    obj (Any): The value to serialize
+
+	Returns:
+	    bytes: The JSON document
+	"""
+	try:
+		return orjson.dumps(obj)
+	except TypeError:
+		return json.dumps(obj).encode()
+
+
+# Every live StreamBuffer, flushed by one shared background thread and at exit
+_stream_buffers: "weakref.WeakSet[StreamBuffer]" = weakref.WeakSet()
+_stream_flusher_lock = threading.Lock()
+_stream_flusher: Optional[threading.Thread] = None
+
+
+def _flush_stream_buffers() -> None:
+	for stream_buffer in list(_stream_buffers):
+		stream_buffer.flush()
+
+
+def _stream_flush_loop() -> None:
+	while True:
+		interval = min((b.interval for b in list(_stream_buffers)), default=0.05)
+		time.sleep(interval)
+		_flush_stream_buffers()
+
+
+atexit.register(_flush_stream_buffers)
+
+
+class StreamBuffer:
+	"""
+	Collect streamed LLM tokens and write them to a text stream in batches.
+
+	Printing every token with flush=True costs a write and flush per token. This
+	buffer instead writes whenever a token contains a newline, and otherwise at
+	most every `interval` seconds from a single background thread shared by all
+	buffers. Pending output is also flushed at interpreter exit.
+
+	Example:
+	    >>> stream_fn = StreamBuffer().write
+	    >>> stream_fn("Hello")  # appears on stdout within 50ms
+	"""
+
+	def __init__(self, interval: float = 0.05, stream: Optional[TextIO] = None):
+		"""
+		Initialize the buffer.
+
+		Args:
+		    interval (float): Maximum seconds a token waits before being written
+		    stream (Optional[TextIO]): Stream to write to, defaults to sys.stdout
+		"""
+		global _stream_flusher
+
+		self.interval = interval
+		self.stream = stream if stream is not None else sys.stdout
+		self._buffer: List[str] = []
+		self._lock = threading.Lock()
+
+		_stream_buffers.add(self)
+		with _stream_flusher_lock:
+			if _stream_flusher is None:
+				_stream_flusher = threading.Thread(
+					target=_stream_flush_loop, name="stream-buffer-flush", daemon=True
+				)
+				_stream_flusher.start()
+
+	def write(self, token: str) -> None:
+		"""
+		Queue a token for output, writing the batch out if it ends a line.
+
+		Args:
+		    token (str): The streamed text
+		"""
+		with self._lock:
+			self._buffer.append(token)
+			if "\n" in token:
+				self._flush_locked()
+
+	def flush(self) -> None:
+		"""Write out everything buffered so far."""
+		with self._lock:
+			self._flush_locked()
+
+	def _flush_locked(self) -> None:
+		if not self._buffer:
+			return
+		self.stream.write("".join(self._buffer))
+		self._buffer.clear()
+		self.stream.flush()
@@ -1,4 +1,4 @@
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Optional, Sequence, Tuple
 
 
 class Message:
@@ -15,7 +15,11 @@ class Message:
 	    metadata (Dict[str, Any]): Additional information about the message
 	"""
 
-	def __init__(self, role: str, content: str, metadata: Dict[str, Any] = {}):
+	__slots__ = ("_content", "_role", "metadata")
+
+	def __init__(
+		self, role: str, content: str, metadata: Optional[Dict[str, Any]] = None
+	):
 		"""
 		Initialize a Message with role, content, and optional metadata.
 
@@ -24,9 +28,19 @@ class Message:
 		    content (str): The text content of the message
 		    metadata (Dict[str, Any], optional): Additional information. Defaults to {}.
 		"""
-		self.role = role
-		self.content = content
-		self.metadata: Dict[str, Any] = metadata
+		self._role = role
+		self._content = content
+		self.metadata: Dict[str, Any] = metadata if metadata is not None else {}
+
+	@property
+	def role(self) -> str:
+		"""The role of the message sender, read-only so histories can cache it"""
+		return self._role
+
+	@property
+	def content(self) -> str:
+		"""The text content of the message, read-only so histories can cache it"""
+		return self._content
 
 	def as_native(self) -> Dict[str, str]:
 		"""
@@ -35,7 +49,7 @@ class Message:
 		Returns:
 		    Dict[str, str]: Dictionary with 'role' and 'content' keys
 		"""
-		return {"role": self.role, "content": self.content}
+		return {"role": self._role, "content": self._content}
 
 	@staticmethod
 	def from_native(native: Dict[str, Any]) -> "Message":
@@ -95,16 +109,37 @@ class ChatHistory:
 	combining histories, and converting between native format and ChatHistory objects.
 	"""
 
-	def __init__(self, messages: List[Message] | Message = []):
+	__slots__ = ("_messages", "_native_cache", "_native_version", "_version")
+
+	def __init__(self, messages: Optional[Sequence[Message] | Message] = None):
 		"""
 		Initialize a ChatHistory with a list of messages or a single message.
 
 		Args:
 		    messages (List[Message] | Message, optional): Initial messages. Defaults to [].
 		"""
-		self.messages: List[Message] = (
-			messages if isinstance(messages, list) else [messages]
-		)
+		# Bumped on every change, `as_native` results are cached per version
+		self._version = 0
+		self._native_cache: Optional[List[Dict[str, str]]] = None
+		self._native_version = -1
+		if messages is None:
+			messages = []
+		self.messages = messages if isinstance(messages, (list, tuple)) else [messages]
+
+	@property
+	def messages(self) -> Tuple[Message, ...]:
+		"""
+		The messages of the conversation, oldest first.
+
+		Handed out as a tuple so the history only changes through its own methods,
+		which keeps the `as_native` cache valid.
+		"""
+		return tuple(self._messages)
+
+	@messages.setter
+	def messages(self, messages: Sequence[Message]) -> None:
+		self._messages = list(messages)
+		self._version += 1
 
 	def __len__(self) -> int:
 		"""
@@ -113,7 +148,7 @@ class ChatHistory:
 		Returns:
 		    int: The number of messages
 		"""
-		return len(self.messages)
+		return len(self._messages)
 
 	def __add__(self, other: "ChatHistory") -> "ChatHistory":
 		"""
@@ -126,7 +161,7 @@ class ChatHistory:
 		    ChatHistory: A new ChatHistory containing messages from both histories
 		"""
 		new_history = ChatHistory()
-		new_history.messages = self.messages.copy() + other.messages.copy()
+		new_history.messages = self._messages + other._messages
 
 		return new_history
 
@@ -141,17 +176,23 @@ class ChatHistory:
 		    ChatHistory: A new ChatHistory with the appended message
 		"""
 		new_history = ChatHistory()
-		new_history.messages = self.messages.copy() + [new_message]
+		new_history.messages = self._messages + [new_message]
 		return new_history
 
 	def as_native(self) -> List[Dict[str, str]]:
 		"""
 		Convert the ChatHistory to a list of native dictionaries.
 
+		The list is cached until the history changes; each call returns a new list
+		but the dictionaries are shared, so callers must not mutate them.
+
 		Returns:
 		    List[Dict[str, str]]: List of message dictionaries
 		"""
-		return [message.as_native() for message in self.messages]
+		if self._native_cache is None or self._native_version != self._version:
+			self._native_cache = [message.as_native() for message in self._messages]
+			self._native_version = self._version
+		return list(self._native_cache)
 
 	def get_latest_response(self) -> str:
 		"""
@@ -160,15 +201,7 @@ class ChatHistory:
 		Returns:
 		    str: The content of the latest assistant message, or empty string if none exists
 		"""
-		assistant_messages = [
-			message for message in self.messages if message.role == "assistant"
-		]
-
-		if (
-			not assistant_messages
-		):  # Only return empty string if there are no assistant messages
-			return ""
-		return assistant_messages[-1].content
+		return self._latest_content("assistant")
 
 	def get_latest_instruction(self) -> str:
 		"""
@@ -177,14 +210,24 @@ class ChatHistory:
 		Returns:
 		    str: The content of the latest user message, or empty string if none exists
 		"""
-		user_messages = [message for message in self.messages if message.role == "user"]
+		return self._latest_content("user")
+
+	def _latest_content(self, role: str) -> str:
+		"""
+		Scan backwards for the most recent message with the given role.
 
-		if (
-			not user_messages
-		):  # Only return empty string if there are no assistant messages
-			return ""
+		Stops at the first match instead of building a filtered copy of the history.
 
-		return user_messages[-1].content
+		Args:
+		    role (str): The role to look for
+
+		Returns:
+		    str: The content of the latest matching message, or empty string if none exists
+		"""
+		for message in reversed(self._messages):
+			if message.role == role:
+				return message.content
+		return ""
 
 	@staticmethod
 	def from_native(native: List[Dict[str, str]]) -> "ChatHistory":
@@ -208,7 +251,7 @@ class ChatHistory:
 		Returns:
 		    str: A formatted string showing all messages in the history
 		"""
-		messages_repr = "\n".join([message.__repr__() for message in self.messages])
+		messages_repr = "\n".join([message.__repr__() for message in self._messages])
 		return f"PList(\n\tmessages=[\n\t\t{messages_repr}\n\t\t]\n)"
 
 	def modify_message_at_index(
@@ -224,7 +267,8 @@ class ChatHistory:
 		Returns:
 		    ChatHistory: The modified ChatHistory (self)
 		"""
-		self.messages[index] = new_message
+		self._messages[index] = new_message
+		self._version += 1
 
 		return self
 
@@ -241,7 +285,7 @@ class ChatHistory:
 		Returns:
 		    ChatHistory: The modified ChatHistory (self)
 		"""
-		self.messages[index].metadata = new_metadata
+		self._messages[index].metadata = new_metadata
 
 		return self
 
@@ -255,4 +299,4 @@ class ChatHistory:
 		Returns:
 		    List[str]: List of values for the specified metadata key from all messages
 		"""
-		return [message.metadata[x] for message in self.messages]
+		return [message.metadata[x] for message in self._messages]
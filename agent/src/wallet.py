@@ -1,7 +1,10 @@
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Tuple
 
 import requests
 from loguru import logger
@@ -10,11 +13,68 @@ from web3 import Web3
 from src.datatypes import WalletStats
 from dotenv import load_dotenv
 from src.db import SQLiteDB
+from src.db.cache import TTLCache
+from src.helper import get_http_session
 
 load_dotenv()
 
+# CoinGecko's simple/token_price endpoint accepts up to 100 contract addresses per call
+COINGECKO_BATCH_SIZE = 100
+
+# Multicall3 is deployed at the same address on mainnet and most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_AGGREGATE3_ABI = [
+	{
+		"inputs": [
+			{
+				"components": [
+					{"name": "target", "type": "address"},
+					{"name": "allowFailure", "type": "bool"},
+					{"name": "callData", "type": "bytes"},
+				],
+				"name": "calls",
+				"type": "tuple[]",
+			}
+		],
+		"name": "aggregate3",
+		"outputs": [
+			{
+				"components": [
+					{"name": "success", "type": "bool"},
+					{"name": "returnData", "type": "bytes"},
+				],
+				"name": "returnData",
+				"type": "tuple[]",
+			}
+		],
+		"stateMutability": "payable",
+		"type": "function",
+	}
+]
+ERC20_BALANCE_OF_ABI = [
+	{
+		"constant": True,
+		"inputs": [{"name": "_owner", "type": "address"}],
+		"name": "balanceOf",
+		"outputs": [{"name": "balance", "type": "uint256"}],
+		"type": "function",
+	}
+]
+# First 4 bytes of keccak("balanceOf(address)")
+ERC20_BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")
+# balanceOf calls bundled into a single aggregate3 eth_call
+MULTICALL_BATCH_SIZE = 500
+
 DB = SQLiteDB(db_path=os.getenv("SQLITE_PATH", "../db/superior-agents.db"))
 
+# Long-lived workers for racing the ETH price providers; a losing request
+# finishes (or times out) in the background instead of delaying the winner
+_ETH_PRICE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="eth-price")
+
+
+class PriceProviderError(Exception):
+	"""Raised when price providers fail or return an unusable price"""
+
 
 def save_to_db(token_addr, symbol, price, metadata=""):
 	token_price = DB.get_token_price(symbol=symbol)
@@ -28,6 +88,22 @@ def save_to_db(token_addr, symbol, price, metadata=""):
 		)
 
 
+def price_path(*keys: Any) -> Callable[[Any], float]:
+	"""Build a price extractor that follows `keys` into a provider's JSON response
+
+	The keys mirror the provider's response schema and must be updated if the
+	provider changes it.
+	"""
+	getters = tuple(itemgetter(key) for key in keys)
+
+	def extract(data: Any) -> float:
+		for getter in getters:
+			data = getter(data)
+		return float(data)
+
+	return extract
+
+
 class PriceProvider:
 	def __init__(self):
 		self.providers = [
@@ -36,14 +112,14 @@ class PriceProvider:
 				"url": "https://api.binance.com/api/v3/ticker/price",
 				"params": {"symbol": "ETHUSDT"},
 				"params_token": lambda x: {"symbol": x.upper() + "USDT"},
-				"price_path": lambda x: float(x["price"]),
+				"price_path": price_path("price"),
 			},
 			{
 				"name": "kraken",
 				"url": "https://api.kraken.com/0/public/Ticker",
 				"params": {"pair": "ETHUSD"},
 				"params_token": lambda x: {"pair": x.upper() + "USD"},
-				"price_path": lambda x: float(x["result"]["XETHZUSD"]["c"][0]),
+				"price_path": price_path("result", "XETHZUSD", "c", 0),
 				"price_path_token": lambda x: float(
 					list(x["result"].values())[0]["c"][0]
 				),
@@ -53,20 +129,22 @@ class PriceProvider:
 				"url": "https://api.huobi.pro/market/detail/merged",
 				"params": {"symbol": "ethusdt"},
 				"params_token": lambda x: {"symbol": x.lower() + "usdt"},
-				"price_path": lambda x: float(x["tick"]["close"]),
+				"price_path": price_path("tick", "close"),
 			},
 			{
 				"name": "coingecko",
 				"url": "https://api.coingecko.com/api/v3/simple/price",
 				"params": {"ids": "ethereum", "vs_currencies": "usd"},
 				"params_token": {"ids": "ethereum", "vs_currencies": "usd"},  # not used
-				"price_path": lambda x: x["ethereum"]["usd"],
+				"price_path": price_path("ethereum", "usd"),
 			},
 		]
 		self._cache_ttl = 60
+		# In-process copy of the latest ETH price, checked before the DB cache
+		self._eth_price_cache = TTLCache(maxsize=1, ttl=self._cache_ttl)
+		self.http_session = get_http_session()
 
-	def _is_cache_valid(self, timestamp: float) -> bool:
-		print(timestamp)
+	def _is_cache_valid(self, timestamp: str) -> bool:
 		return (
 			datetime.now() - datetime.fromisoformat(timestamp)
 		).total_seconds() < self._cache_ttl
@@ -79,7 +157,7 @@ class PriceProvider:
 
 		for attempt in range(max_retries):
 			try:
-				response = requests.get(
+				response = self.http_session.get(
 					"https://api.coingecko.com/api/v3/simple/token_price/ethereum",
 					params={
 						"contract_addresses": token_address,
@@ -114,69 +192,139 @@ class PriceProvider:
 			"coingecko_provider_by_contract_address: Coingecko providers failed"
 		)
 
-	def get_eth_price(self, max_retries: int = 3) -> float:
-		"""Get ETH price using multiple providers with failover"""
-		token_eth = DB.get_token_price(symbol="ETH")
+	def coingecko_provider_by_contract_addresses(
+		self, tokens: Dict[str, str], max_retries: int = 3
+	) -> Dict[str, float]:
+		"""Get prices for many tokens from CoinGecko, up to 100 contract addresses per request
 
-		if token_eth:
-			if self._is_cache_valid(token_eth.last_updated_at):
-				return token_eth.price
+		`tokens` maps contract address to symbol; tokens CoinGecko has no price for are
+		left out of the result.
+		"""
+		base_delay = 1.0
+		prices = {}
+		token_addresses = list(tokens)
 
-		errors = []
-		for provider in self.providers:
+		for start in range(0, len(token_addresses), COINGECKO_BATCH_SIZE):
+			chunk = token_addresses[start : start + COINGECKO_BATCH_SIZE]
+			data = {}
 			for attempt in range(max_retries):
 				try:
-					print(f"Trying to get ETH price from {provider['name']}")
-					response = requests.get(
-						provider["url"],
-						params=provider["params"],
-						headers={"Accept": "application/json"},
+					response = self.http_session.get(
+						"https://api.coingecko.com/api/v3/simple/token_price/ethereum",
+						params={
+							"contract_addresses": ",".join(chunk),
+							"vs_currencies": "usd",
+						},
 						timeout=10,
 					)
-
-					if response.status_code == 429:  # Rate limit
-						wait_time = 2.0 * (2**attempt)
-						print(
-							f"Rate limited by {provider['name']}, waiting {wait_time}s"
-						)
-						time.sleep(wait_time)
-						continue
-
-					if response.status_code == 200:
-						data = response.json()
-						price = provider["price_path"](data)
-
-						if isinstance(price, (int, float)) and price > 0:
-							# Update cache
-							save_to_db(
-								token_addr="default_eth_contract_addr",
-								symbol="ETH",
-								price=price,
-							)
-							print(f"Successfully got ETH price from {provider['name']}")
-							return price
-
+					response.raise_for_status()
+					data = response.json() or {}
+					break
 				except Exception as e:
-					logger.error(f"get_eth_price.err {e}")
-					error_msg = f"{provider['name']}: {str(e)}"
-					if "port=443)" in error_msg:
+					if attempt == max_retries - 1:
 						logger.error(
-							f"get_eth_price.err {provider['name']}: {provider['url']} doesn't work on your network, trying other provider..."
+							f"Failed to get CoinGecko prices for {len(chunk)} tokens: {e}"
 						)
 						break
-					errors.append(error_msg)
-					print(f"Error with {error_msg}")
+					time.sleep(base_delay * (2**attempt))
 
-					if attempt < max_retries - 1:
-						time.sleep(2**attempt)
+			for token_address in chunk:
+				entry = data.get(token_address.lower())
+				if not entry or "usd" not in entry:
 					continue
+				price = float(entry["usd"])
+				prices[token_address] = price
+				save_to_db(
+					token_addr=token_address,
+					symbol=tokens[token_address],
+					price=price,
+					metadata="coingecko",
+				)
+
+		return prices
+
+	def get_eth_price(self, max_retries: int = 3) -> float:
+		"""Get ETH price using multiple providers with failover"""
+		hit, price = self._eth_price_cache.get("eth")
+		if hit:
+			return price
+
+		token_eth = DB.get_token_price(symbol="ETH")
+
+		if token_eth:
+			if self._is_cache_valid(token_eth.last_updated_at):
+				self._eth_price_cache.put("eth", token_eth.price)
+				return token_eth.price
+
+		errors = []
+		for attempt in range(max_retries):
+			try:
+				name, price = self._race_eth_price()
+			except PriceProviderError as e:
+				logger.error(f"get_eth_price.err {e}")
+				errors.append(str(e))
+				if attempt < max_retries - 1:
+					time.sleep(2**attempt)
+				continue
+
+			# Update cache
+			save_to_db(
+				token_addr="default_eth_contract_addr",
+				symbol="ETH",
+				price=price,
+			)
+			self._eth_price_cache.put("eth", price)
+			print(f"Successfully got ETH price from {name}")
+			return price
+
 		# If we have a cached price, return it as fallback
 		token_eth = DB.get_token_price(symbol="ETH")
 		if token_eth:
 			print("Using cached price as fallback")
 			return token_eth.price
 
-		raise Exception(f"All providers failed: {'; '.join(errors)}")
+		raise PriceProviderError(f"All providers failed: {'; '.join(errors)}")
+
+	def _fetch_eth_price(self, provider: dict) -> Tuple[str, float]:
+		"""Ask a single provider for the ETH price"""
+		try:
+			response = self.http_session.get(
+				provider["url"],
+				params=provider["params"],
+				headers={"Accept": "application/json"},
+				timeout=10,
+			)
+			response.raise_for_status()
+			price = provider["price_path"](response.json())
+		except (requests.RequestException, LookupError, TypeError, ValueError) as e:
+			raise PriceProviderError(f"{provider['name']}: {e!s}") from e
+
+		if price <= 0:
+			raise PriceProviderError(f"{provider['name']}: invalid price {price!r}")
+		return provider["name"], price
+
+	def _race_eth_price(self) -> Tuple[str, float]:
+		"""Query all ETH price providers at once and return the first valid answer
+
+		A slow or unreachable provider no longer delays the others; requests that
+		have not started yet are cancelled as soon as one provider succeeds.
+		"""
+		futures = [
+			_ETH_PRICE_POOL.submit(self._fetch_eth_price, provider)
+			for provider in self.providers
+		]
+		errors = []
+		try:
+			for future in as_completed(futures):
+				try:
+					return future.result()
+				except PriceProviderError as e:
+					errors.append(str(e))
+		finally:
+			for future in futures:
+				future.cancel()
+
+		raise PriceProviderError("; ".join(errors))
 
 	def get_token_price(self, token_address, symbol, max_retries: int = 3) -> float:
 		"""Get token price using multiple providers with failover"""
@@ -194,7 +342,7 @@ class PriceProvider:
 				try:
 					print(f"Trying to get token price from {provider['name']}")
 					new_params = provider["params_token"](token_symbol)
-					response = requests.get(
+					response = self.http_session.get(
 						provider["url"],
 						params=new_params,
 						headers={"Accept": "application/json"},
@@ -295,7 +443,22 @@ def get_token_prices_v2(
 	base_delay = 1.0
 	prices = {}
 
+	# Serve fresh cached prices, then price everything else with batched CoinGecko
+	# requests; only tokens CoinGecko can't price go through per-token failover
+	pending = {}
 	for token_addr, symbol in zip(token_addresses, symbols):
+		token_price = DB.get_token_price(symbol=symbol)
+		if token_price and _price_provider._is_cache_valid(token_price.last_updated_at):
+			prices[token_addr] = float(token_price.price)
+		else:
+			pending[token_addr] = symbol
+
+	if pending:
+		prices.update(_price_provider.coingecko_provider_by_contract_addresses(pending))
+
+	for token_addr, symbol in pending.items():
+		if token_addr in prices:
+			continue
 		for attempt in range(max_retries):
 			try:
 				data = _price_provider.get_token_price(token_addr, symbol)
@@ -334,7 +497,7 @@ def get_token_transactions(
 			logger.info(
 				f"Fetching token transactions from Etherscan (attempt {attempt + 1}/{max_retries})"
 			)
-			response = requests.get(url, params=params, timeout=10)
+			response = get_http_session().get(url, params=params, timeout=10)
 
 			if response.status_code == 429:  # Rate limit
 				wait_time = 2.0 * (2**attempt)
@@ -364,6 +527,60 @@ def get_token_transactions(
 	return {"status": "0", "message": "Max retries exceeded", "result": []}
 
 
+@lru_cache(maxsize=4)
+def get_web3(infura_project_id: str) -> Web3:
+	"""Get the mainnet Web3 client of an Infura project, created once per project"""
+	return Web3(Web3.HTTPProvider(f"https://mainnet.infura.io/v3/{infura_project_id}"))
+
+
+@lru_cache(maxsize=4096)
+def to_checksum_address(address: str) -> str:
+	"""Checksum an address, memoized since the same tokens recur on every call"""
+	return Web3.to_checksum_address(address)
+
+
+def get_token_balances(
+	w3: Web3, owner: str, token_addresses: List[str]
+) -> Dict[str, int]:
+	"""Get the raw ERC-20 balance of `owner` for every token via Multicall3
+
+	All balanceOf calls are bundled into aggregate3 eth_calls (one per
+	MULTICALL_BATCH_SIZE tokens) instead of one RPC round trip per token. If a
+	multicall fails, that chunk falls back to individual balanceOf calls. Tokens
+	whose call reverts are left out of the result.
+	"""
+	owner = to_checksum_address(owner)
+	call_data = ERC20_BALANCE_OF_SELECTOR + bytes.fromhex(owner[2:]).rjust(32, b"\0")
+	multicall = w3.eth.contract(
+		address=MULTICALL3_ADDRESS, abi=MULTICALL3_AGGREGATE3_ABI
+	)
+
+	balances = {}
+	for start in range(0, len(token_addresses), MULTICALL_BATCH_SIZE):
+		chunk = token_addresses[start : start + MULTICALL_BATCH_SIZE]
+		try:
+			results = multicall.functions.aggregate3(
+				[(token_addr, True, call_data) for token_addr in chunk]
+			).call()
+		except Exception as e:
+			logger.warning(f"Multicall balanceOf failed, querying one by one: {e}")
+			for token_addr in chunk:
+				try:
+					contract = w3.eth.contract(
+						address=token_addr, abi=ERC20_BALANCE_OF_ABI
+					)
+					balances[token_addr] = contract.functions.balanceOf(owner).call()
+				except Exception as e:
+					print(f"Error processing token {token_addr}: {str(e)}")
+			continue
+
+		for token_addr, (success, return_data) in zip(chunk, results):
+			if success and len(return_data) >= 32:
+				balances[token_addr] = int.from_bytes(return_data[:32], "big")
+
+	return balances
+
+
 def get_wallet_stats(
 	address: str, infura_project_id: str, etherscan_key: str
 ) -> WalletStats:
@@ -390,64 +607,60 @@ def get_wallet_stats(
 	Raises:
 		Exception: If the agent's Ethereum address cannot be retrieved
 	"""
-	w3 = Web3(Web3.HTTPProvider(f"https://mainnet.infura.io/v3/{infura_project_id}"))
+	w3 = get_web3(infura_project_id)
 
 	logger.info(f"Fetching wallet stats for address: {address}")
 
-	# Get ETH balance
-	eth_balance = w3.eth.get_balance(address)  # type: ignore
-	eth_nonce = w3.eth.get_transaction_count(address)  # type: ignore
+	with ThreadPoolExecutor(max_workers=1) as pool:
+		# Get tokens from Etherscan while the RPC batch below is in flight
+		token_txns_future = pool.submit(get_token_transactions, address, etherscan_key)
+
+		# Get ETH balance and nonce in a single JSON-RPC round trip
+		with w3.batch_requests() as batch:
+			batch.add(w3.eth.get_balance(address))  # type: ignore
+			batch.add(w3.eth.get_transaction_count(address))  # type: ignore
+			eth_balance, eth_nonce = batch.execute()
+
+		data = token_txns_future.result()
+
 	eth_balance_human = float(w3.from_wei(eth_balance, "ether"))
 
 	# Reserve ETH for gas fees (0.01 ETH)
 	eth_reserve = 0.01
 	eth_available = max(0.0, eth_balance_human - eth_reserve)
 
-	# Get tokens from Etherscan
-	data = get_token_transactions(address, etherscan_key)
-
 	tokens = {}
 	if "result" in data:
 		token_txns = data["result"]
 		if isinstance(token_txns, list):
+			# Transactions are newest first; keep one per token for symbol/decimals
+			token_txs = {}
 			for tx in token_txns:
 				if isinstance(tx, dict):
 					# Convert token address to checksum format
 					try:
-						token_addr = w3.to_checksum_address(
-							tx.get("contractAddress", "")
-						)
-						if token_addr and token_addr not in tokens:
-							# Simple contract to get balance
-							contract = w3.eth.contract(
-								address=token_addr,
-								abi=[
-									{
-										"constant": True,
-										"inputs": [
-											{"name": "_owner", "type": "address"}
-										],
-										"name": "balanceOf",
-										"outputs": [
-											{"name": "balance", "type": "uint256"}
-										],
-										"type": "function",
-									}
-								],
-							)
-
-							balance = contract.functions.balanceOf(address).call()
-							decimal = int(tx.get("tokenDecimal", "18"))
-							if balance > 0:
-								tokens[token_addr] = {
-									"symbol": tx.get("tokenSymbol", "UNKNOWN"),
-									"balance": balance / (10**decimal),
-								}
+						token_addr = to_checksum_address(tx.get("contractAddress", ""))
 					except Exception as e:
 						print(
 							f"Error processing token {tx.get('contractAddress')}: {str(e)}"
 						)
 						continue
+					if token_addr and token_addr not in token_txs:
+						token_txs[token_addr] = tx
+
+			balances = get_token_balances(w3, address, list(token_txs))
+			for token_addr, tx in token_txs.items():
+				balance = balances.get(token_addr, 0)
+				try:
+					decimal = int(tx.get("tokenDecimal", "18"))
+				except ValueError as e:
+					print(f"Error processing token {token_addr}: {str(e)}")
+					continue
+				if balance > 0:
+					tokens[token_addr] = {
+						"symbol": tx.get("tokenSymbol", "UNKNOWN"),
+						"balance": balance / (10**decimal),
+					}
 
 		# Gets real-time ETH price from CoinGecko
 		try:
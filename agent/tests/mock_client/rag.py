@@ -44,7 +44,7 @@ class MockRAGClient:
 
 		for data in batch_data:
 			if isinstance(data.created_at, datetime):
-				data.created_at = data.created_at.isoformat()
+				data = dataclasses.replace(data, created_at=data.created_at.isoformat())
 
 			if isinstance(data.parameters, str):
 				try:
@@ -7,34 +7,36 @@ from decimal import Decimal
 import time
 
 # Mock current prices (as of a point in time)
-mock_portfolio: PortfolioStatus = {
-	"total_value_usd": 100.00,  # $30 USDT + $40 ETH + $30 MATIC
-	"total_change_24h": -2.15,  # Weighted average of all tokens' 24h changes
-	"eth_balance": Decimal("0.0166"),  # ~$40 worth of ETH at $2400/ETH
-	"token_balances": [
-		{
-			"token_address": "0xdac17f958d2ee523a2206206994597c13d831ec7",  # USDT contract
-			"symbol": "USDT",
-			"name": "Tether USD",
-			"balance": Decimal("30.00"),  # 30 USDT
-			"decimals": 6,
-			"price_usd": 1.00,
-			"value_usd": 30.00,
-			"change_24h": -0.01,  # Very stable as it's a stablecoin
-		},
-		{
-			"token_address": "0x7D1AfA7B718fb893dB30A3aBc0Cfc608AaCfeBB0",  # MATIC contract
-			"symbol": "MATIC",
-			"name": "Polygon",
-			"balance": Decimal("33.33"),  # ~$30 worth at ~$0.90/MATIC
-			"decimals": 18,
-			"price_usd": 0.90,
-			"value_usd": 30.00,
-			"change_24h": -5.23,  # More volatile
-		},
-	],
-	"timestamp": int(time.time()),  # Current Unix timestamp
-}
+mock_portfolio = PortfolioStatus.from_dict(
+	{
+		"total_value_usd": 100.00,  # $30 USDT + $40 ETH + $30 MATIC
+		"total_change_24h": -2.15,  # Weighted average of all tokens' 24h changes
+		"eth_balance": Decimal("0.0166"),  # ~$40 worth of ETH at $2400/ETH
+		"token_balances": [
+			{
+				"token_address": "0xdac17f958d2ee523a2206206994597c13d831ec7",  # USDT contract
+				"symbol": "USDT",
+				"name": "Tether USD",
+				"balance": Decimal("30.00"),  # 30 USDT
+				"decimals": 6,
+				"price_usd": 1.00,
+				"value_usd": 30.00,
+				"change_24h": -0.01,  # Very stable as it's a stablecoin
+			},
+			{
+				"token_address": "0x7D1AfA7B718fb893dB30A3aBc0Cfc608AaCfeBB0",  # MATIC contract
+				"symbol": "MATIC",
+				"name": "Polygon",
+				"balance": Decimal("33.33"),  # ~$30 worth at ~$0.90/MATIC
+				"decimals": 18,
+				"price_usd": 0.90,
+				"value_usd": 30.00,
+				"change_24h": -5.23,  # More volatile
+			},
+		],
+		"timestamp": int(time.time()),  # Current Unix timestamp
+	}
+)
 
 
 class MockTradingSensor:
@@ -4,12 +4,22 @@ from typing import Generic, List, TypeVar
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from loguru import logger
 
 from src.fetch import get_data_raw, get_data_raw_v3, get_data_raw_v4
-from src.store import save_result as save_result, save_result_v4
+from src.store import (
+	save_result as save_result,
+	save_result_batch,
+	save_result_batch_v4,
+	save_result_v4,
+)
+
+
+def now():
+	return datetime.now().isoformat()
 
 
 class SaveResultParams(BaseModel):
@@ -18,7 +28,7 @@ class SaveResultParams(BaseModel):
 	strategy: str
 	strategy_data: str
 	reference_id: str
-	created_at: str = datetime.now().isoformat()
+	created_at: str = Field(default_factory=now)
 
 
 class SaveResultParamsV4(BaseModel):
@@ -27,7 +37,7 @@ class SaveResultParamsV4(BaseModel):
 	reference_id: str
 	agent_id: str
 	session_id: str
-	created_at: str = datetime.now().isoformat()
+	created_at: str = Field(default_factory=now)
 
 
 logger.info("App is starting")
@@ -43,10 +53,6 @@ async def health_check():
 	return {"status": "healthy"}
 
 
-def now():
-	return datetime.now().isoformat()
-
-
 T = TypeVar("T")
 
 
@@ -62,7 +68,7 @@ class GetRelevantStrategyRawParams(BaseModel):
 	session_id: str
 	top_k: int = 5
 	threshold: float = 0.7
-	created_at: str = datetime.now().isoformat()
+	created_at: str = Field(default_factory=now)
 
 
 class RelevantStrategyData(BaseModel):
@@ -86,7 +92,8 @@ async def get_relevant_document_raw(
 		top_k = params.top_k
 		threshold = params.threshold
 
-		data = get_data_raw(
+		data = await run_in_threadpool(
+			get_data_raw,
 			query=query,
 			agent_id=agent_id,
 			session_id=session_id,
@@ -160,7 +167,8 @@ async def get_relevant_document_raw_v2(
 		_ = params.session_id
 		top_k = params.top_k
 
-		data = get_data_raw_v3(
+		data = await run_in_threadpool(
+			get_data_raw_v3,
 			query=query,
 			agent_id=agent_id,
 			top_k=top_k,
@@ -233,7 +241,8 @@ async def get_relevant_document_raw_v4(
 		_ = params.session_id
 		top_k = params.top_k
 
-		data = get_data_raw_v4(  # noqa: F821
+		data = await run_in_threadpool(
+			get_data_raw_v4,  # noqa: F821
 			notification_query=notification_query,
 			agent_id=agent_id,
 			top_k=top_k,
@@ -288,7 +297,8 @@ async def store_execution_result(request: Request, params: SaveResultParams):
 		reference_id = params.reference_id
 		created_at = params.created_at
 
-		output = save_result(
+		output = await run_in_threadpool(
+			save_result,
 			strategy=strategy,
 			reference_id=reference_id,
 			strategy_data=strategy_data,
@@ -318,7 +328,8 @@ async def store_execution_result(request: Request, params: SaveResultParams):
 @app.post("/save_result_v4")
 async def store_execution_result_v4(request: Request, params: SaveResultParamsV4):
 	try:
-		output = save_result_v4(
+		output = await run_in_threadpool(
+			save_result_v4,
 			notification_key=params.notification_key,
 			strategy_id=params.reference_id,
 			strategy_data=params.strategy_data,
@@ -347,17 +358,9 @@ async def store_execution_result_v4(request: Request, params: SaveResultParamsV4
 @app.post("/save_result_batch")
 async def store_execution_result_batch(params: List[SaveResultParams]):
 	try:
-		outputs = []
-		for item in params:
-			output = save_result(
-				strategy=item.strategy,
-				reference_id=item.reference_id,
-				strategy_data=item.strategy_data,
-				agent_id=item.agent_id,
-				session_id=item.session_id,
-				created_at=item.created_at,
-			)
-			outputs.append(output)
+		outputs = await run_in_threadpool(
+			save_result_batch, [item.model_dump() for item in params]
+		)
 
 		return TypicalResponse(
 			status="success",
@@ -380,16 +383,19 @@ async def store_execution_result_batch(params: List[SaveResultParams]):
 @app.post("/save_result_batch_v4")
 async def store_execution_result_batch_v4(params: List[SaveResultParamsV4]):
 	try:
-		outputs = []
-		for item in params:
-			output = save_result_v4(
-				notification_key=item.notification_key,
-				strategy_id=item.reference_id,
-				strategy_data=item.strategy_data,
-				agent_id=item.agent_id,
-				created_at=item.created_at,
-			)
-			outputs.append(output)
+		outputs = await run_in_threadpool(
+			save_result_batch_v4,
+			[
+				{
+					"notification_key": item.notification_key,
+					"strategy_id": item.reference_id,
+					"strategy_data": item.strategy_data,
+					"agent_id": item.agent_id,
+					"created_at": item.created_at,
+				}
+				for item in params
+			],
+		)
 
 		return TypicalResponse(
 			status="success",
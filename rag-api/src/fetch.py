@@ -1,13 +1,14 @@
 from glob import glob
 import os
-from typing import List, Tuple
+from contextlib import AbstractContextManager, nullcontext
+from typing import List, Optional, Tuple
 
 from dotenv import load_dotenv
 from langchain_community.vectorstores.faiss import FAISS
 from langchain_core.documents import Document
 from loguru import logger
 
-from src.store import get_embeddings
+from src.store import get_embeddings, get_kb_lock, get_vectorstore, load_vectorstore
 
 load_dotenv()
 
@@ -37,24 +38,39 @@ def convert_threshold(threshold_0_to_1: float) -> float:
 
 
 def get_context_from_kb(
-	vectorstore: FAISS, query: str, num_chunks: int, threshold: float
+	vectorstore: FAISS,
+	query: str,
+	num_chunks: int,
+	threshold: float,
+	lock: Optional[AbstractContextManager] = None,
 ):
-	vector_retriever = vectorstore.as_retriever(
-		search_type="similarity_score_threshold",
-		search_kwargs={
-			"k": num_chunks,
-			"score_threshold": convert_threshold(threshold),
-		},
-	)
-	result_docs = vector_retriever.invoke(query)
+	# Same filtering as the "similarity_score_threshold" retriever, but the query
+	# is embedded (an OpenAI round trip) before `lock` is taken, not inside it.
+	# KBs use the COSINE strategy, where relevance is 1 - distance, so the
+	# relevance threshold becomes a maximum distance for FAISS to filter on
+	max_distance = 1 - convert_threshold(threshold)
+	embedding = get_embeddings().embed_query(query)
+	with lock or nullcontext():
+		results_with_scores = vectorstore.similarity_search_with_score_by_vector(
+			embedding, k=num_chunks, score_threshold=max_distance
+		)
 
-	return result_docs
+	return [doc for doc, _ in results_with_scores]
 
 
-def get_context_from_kb_with_top_k(vectorstore: FAISS, query: str, num_chunks: int):
+def get_context_from_kb_with_top_k(
+	vectorstore: FAISS,
+	query: str,
+	num_chunks: int,
+	lock: Optional[AbstractContextManager] = None,
+):
 	# Use similarity_search_with_score without a threshold
 	# This will return the top k results regardless of their score
-	results_with_scores = vectorstore.similarity_search_with_score(query, k=num_chunks)
+	embedding = get_embeddings().embed_query(query)
+	with lock or nullcontext():
+		results_with_scores = vectorstore.similarity_search_with_score_by_vector(
+			embedding, k=num_chunks
+		)
 
 	logger.info(f"`len(results_with_scores)`: {len(results_with_scores)}")
 
@@ -65,19 +81,15 @@ def get_data_raw(
 	query: str, agent_id: str, session_id: str, top_k: int, threshold: float
 ):
 	kb_id = f"{agent_id}_{session_id}"
-	if not os.path.exists(f"pkl/{kb_id}.pkl"):
+	vectorstore = get_vectorstore(kb_id)
+	if vectorstore is None:
 		raise Exception(
 			"No vector database has been made. Please run the agent at least one time"
 		)
-
-	vectorstore = FAISS.load_local(
-		"pkl/",
-		get_embeddings(),
-		kb_id,
-		allow_dangerous_deserialization=True,
-		distance_strategy="COSINE",
+	# FAISS indexes aren't safe to search while another thread adds to them
+	documents = get_context_from_kb(
+		vectorstore, query, top_k, threshold, lock=get_kb_lock(kb_id)
 	)
-	documents = get_context_from_kb(vectorstore, query, top_k, threshold)
 
 	format_docs = [
 		{
@@ -97,22 +109,16 @@ def get_data_raw_v2(
 	top_k: int,
 ) -> List[Tuple[Document, float]]:
 	kb_id = f"{agent_id}_{session_id}"
-
-	if not os.path.exists(f"pkl/{kb_id}.pkl"):
+	vectorstore = get_vectorstore(kb_id)
+	if vectorstore is None:
 		raise Exception(
 			"No vector database has been made. Please run the agent at least one time"
 		)
 
-	vectorstore = FAISS.load_local(
-		"pkl/",
-		get_embeddings(),
-		kb_id,
-		allow_dangerous_deserialization=True,
-		distance_strategy="COSINE",
-	)
-
 	# Always get top_k results
-	return get_context_from_kb_with_top_k(vectorstore, query, top_k)
+	return get_context_from_kb_with_top_k(
+		vectorstore, query, top_k, lock=get_kb_lock(kb_id)
+	)
 
 
 def get_data_raw_v3(
@@ -138,13 +144,7 @@ def get_data_raw_v3(
 	base_name = os.path.basename(matching_files[0]).replace(".pkl", "")
 	logger.info(f"Initializing vectorstore with `base_name` = {base_name}")
 
-	vectorstore = FAISS.load_local(
-		"pkl/",
-		get_embeddings(),
-		base_name,
-		allow_dangerous_deserialization=True,
-		distance_strategy="COSINE",
-	)
+	vectorstore = load_vectorstore(base_name, "pkl/")
 
 	for file_path in matching_files[1:]:
 		base_name = os.path.basename(file_path).replace(".pkl", "")
@@ -152,13 +152,7 @@ def get_data_raw_v3(
 			f"Merging the initialized vectorstore with `base_name` = {base_name}"
 		)
 
-		additional_index = FAISS.load_local(
-			"pkl/",
-			get_embeddings(),
-			base_name,
-			allow_dangerous_deserialization=True,
-			distance_strategy="COSINE",
-		)
+		additional_index = load_vectorstore(base_name, "pkl/")
 		vectorstore.merge_from(additional_index)
 
 	# Always get top_k results
@@ -186,13 +180,7 @@ def get_data_raw_v4(
 	base_name = os.path.basename(matching_files[0]).replace(".pkl", "")
 	logger.info(f"Initializing vectorstore with `base_name` = {base_name}")
 
-	vectorstore = FAISS.load_local(
-		"pkl/v4/",
-		get_embeddings(),
-		base_name,
-		allow_dangerous_deserialization=True,
-		distance_strategy="COSINE",
-	)
+	vectorstore = load_vectorstore(base_name, "pkl/v4/")
 
 	for file_path in matching_files[1:]:
 		base_name = os.path.basename(file_path).replace(".pkl", "")
@@ -200,13 +188,7 @@ def get_data_raw_v4(
 			f"Merging the initialized vectorstore with `base_name` = {base_name}"
 		)
 
-		additional_index = FAISS.load_local(
-			"pkl/v4/",
-			get_embeddings(),
-			base_name,
-			allow_dangerous_deserialization=True,
-			distance_strategy="COSINE",
-		)
+		additional_index = load_vectorstore(base_name, "pkl/v4/")
 		vectorstore.merge_from(additional_index)
 
 	# Always get top_k results
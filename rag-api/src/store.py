@@ -1,5 +1,9 @@
 import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from langchain_community.docstore.document import Document
 from langchain_community.vectorstores.faiss import FAISS
@@ -12,7 +16,17 @@ PKL_PATH = "pkl/"
 os.makedirs("pkl/", exist_ok=True)
 os.makedirs("pkl/v4", exist_ok=True)
 
+# Vectorstores stay loaded between requests, keyed by (pkl folder, kb_id)
+MAX_CACHED_VECTORSTORES = 32
+_VS_CACHE: "OrderedDict[Tuple[str, str], FAISS]" = OrderedDict()
+_VS_LOCK = threading.RLock()
+# Document ids of every cached vectorstore, for O(1) duplicate checks
+_IDS_CACHE: Dict[Tuple[str, str], Set[str]] = {}
+# One writer lock per KB, so ingesting into one KB doesn't block the others
+_KB_LOCKS: Dict[Tuple[str, str], threading.RLock] = {}
 
+
+@lru_cache(maxsize=1)
 def get_embeddings():
 	return OpenAIEmbeddings(
 		openai_api_key=OPENAI_API_KEY,  # type: ignore
@@ -22,26 +36,114 @@ def get_embeddings():
 	)
 
 
-def check_if_reference_id_exists_in_kb(
-	kb_id: str, strategy_id: str, pkl_folder=PKL_PATH
-):
-	pkl_folder = pkl_folder.rstrip("/")
-	pkl_path = f"{pkl_folder}/{kb_id}.pkl"
+def cache_vectorstore(kb_id: str, vectorstore: FAISS, pkl_folder=PKL_PATH):
+	key = (os.path.normpath(pkl_folder), kb_id)
+
+	with _VS_LOCK:
+		_VS_CACHE[key] = vectorstore
+		_VS_CACHE.move_to_end(key)
+		_IDS_CACHE[key] = set(vectorstore.index_to_docstore_id.values())
+		while len(_VS_CACHE) > MAX_CACHED_VECTORSTORES:
+			evicted_key, _ = _VS_CACHE.popitem(last=False)
+			_IDS_CACHE.pop(evicted_key, None)
+
+
+def get_known_ids(kb_id: str, pkl_folder=PKL_PATH) -> Set[str]:
+	"""
+	Get the ids of the documents already in a KB, loading the KB if needed.
+	The returned set is shared with the cache, treat it as read-only.
+	"""
+	vectorstore = get_vectorstore(kb_id, pkl_folder)
+	if vectorstore is None:
+		return set()
+
+	key = (os.path.normpath(pkl_folder), kb_id)
+	with _VS_LOCK:
+		known_ids = _IDS_CACHE.get(key)
+	if known_ids is None:
+		known_ids = set(vectorstore.index_to_docstore_id.values())
+	return known_ids
+
+
+def remember_ids(kb_id: str, ids: Iterable[str], pkl_folder=PKL_PATH):
+	key = (os.path.normpath(pkl_folder), kb_id)
+
+	with _VS_LOCK:
+		if key in _IDS_CACHE:
+			_IDS_CACHE[key].update(ids)
+
+
+def get_kb_lock(kb_id: str, pkl_folder=PKL_PATH) -> threading.RLock:
+	key = (os.path.normpath(pkl_folder), kb_id)
+
+	with _VS_LOCK:
+		return _KB_LOCKS.setdefault(key, threading.RLock())
+
 
-	if os.path.exists(pkl_path):
-		vectorstore = FAISS.load_local(
-			pkl_folder,
+def get_vectorstore(kb_id: str, pkl_folder=PKL_PATH) -> Optional[FAISS]:
+	"""
+	Get the vectorstore of a KB, unpickling it from disk only on first use.
+	The least recently used KBs are dropped once more than
+	`MAX_CACHED_VECTORSTORES` are loaded. Returns None if the KB doesn't exist yet.
+	"""
+	pkl_folder = os.path.normpath(pkl_folder)
+	key = (pkl_folder, kb_id)
+
+	with _VS_LOCK:
+		vectorstore = _VS_CACHE.get(key)
+		if vectorstore is not None:
+			_VS_CACHE.move_to_end(key)
+			return vectorstore
+
+	# Unpickle outside the global lock; other KBs stay available meanwhile
+	with get_kb_lock(kb_id, pkl_folder):
+		with _VS_LOCK:
+			vectorstore = _VS_CACHE.get(key)
+		if vectorstore is not None:
+			return vectorstore
+
+		if not os.path.exists(f"{pkl_folder}/{kb_id}.pkl"):
+			return None
+
+		vectorstore = load_vectorstore(kb_id, pkl_folder)
+		cache_vectorstore(kb_id, vectorstore, pkl_folder)
+		return vectorstore
+
+
+def load_vectorstore(kb_id: str, pkl_folder=PKL_PATH) -> FAISS:
+	"""
+	Unpickle a fresh, uncached copy of a KB from disk.
+	Holds the KB lock so `save_vectorstore` can't swap the .faiss and .pkl files
+	between the two reads.
+	"""
+	with get_kb_lock(kb_id, pkl_folder):
+		return FAISS.load_local(
+			os.path.normpath(pkl_folder),
 			get_embeddings(),
 			kb_id,
 			allow_dangerous_deserialization=True,
 			distance_strategy="COSINE",
 		)
-		documents = vectorstore.index_to_docstore_id.values()
 
-		for doc_id in documents:
-			if doc_id == strategy_id:
-				return True
-	return False
+
+def save_vectorstore(vectorstore: FAISS, kb_id: str, pkl_folder=PKL_PATH):
+	"""
+	Write a KB under a temporary name and move it into place, so a reader never
+	loads a half-written file. The .faiss and .pkl files are replaced one after
+	the other, so callers must hold the KB lock, which every loader also takes.
+	"""
+	pkl_folder = os.path.normpath(pkl_folder)
+	tmp_name = f".{kb_id}.tmp"
+
+	vectorstore.save_local(pkl_folder, tmp_name)
+	for ext in ("faiss", "pkl"):
+		os.replace(f"{pkl_folder}/{tmp_name}.{ext}", f"{pkl_folder}/{kb_id}.{ext}")
+
+
+def check_if_reference_id_exists_in_kb(
+	kb_id: str, strategy_id: str, pkl_folder=PKL_PATH
+):
+	return strategy_id in get_known_ids(kb_id, pkl_folder)
 
 
 def check_pkl_exists(kb_id: str, pkl_folder=PKL_PATH):
@@ -56,47 +158,48 @@ def save_result(
 	agent_id: str,
 	session_id: str,
 	strategy_data: str,
-	created_at: str = datetime.now().isoformat(),
+	created_at: Optional[str] = None,
 ) -> str:
 	kb_id = f"{agent_id}_{session_id}"
 	text = f"Strategy: {strategy}\n"
+	if created_at is None:
+		created_at = datetime.now().isoformat()
+
+	with get_kb_lock(kb_id):
+		is_exist = check_pkl_exists(kb_id)
+
+		if (
+			check_if_reference_id_exists_in_kb(kb_id=kb_id, strategy_id=reference_id)
+			and is_exist
+		):
+			print("Document already exists")
+			return "Document already exists"
+
+		document = Document(
+			page_content=text,
+			metadata={
+				"reference_id": reference_id,
+				"strategy_data": strategy_data,
+				"created_at": created_at,
+			},
+		)
 
-	is_exist = check_pkl_exists(kb_id)
-
-	if check_if_reference_id_exists_in_kb(reference_id, kb_id) and is_exist:
-		print("Document already exists")
-		return "Document already exists"
-
-	document = Document(
-		page_content=text,
-		metadata={
-			"reference_id": reference_id,
-			"strategy_data": strategy_data,
-			"created_at": created_at,
-		},
-	)
-
-	documents = [document]
-	for doc in documents:
-		doc.id = str(reference_id)
+		documents = [document]
+		for doc in documents:
+			doc.id = str(reference_id)
 
-	embeddings = get_embeddings()
+		vectorstore = get_vectorstore(kb_id, pkl_folder="pkl/")
 
-	if is_exist:
-		vectorstore = FAISS.load_local(
-			"pkl/",
-			embeddings,
-			kb_id,
-			allow_dangerous_deserialization=True,
-			distance_strategy="COSINE",
-		)
-		vectorstore.add_documents(documents)
-	else:
-		vectorstore = FAISS.from_documents(
-			documents, embeddings, distance_strategy="COSINE"
-		)
+		if vectorstore is not None:
+			vectorstore.add_documents(documents)
+			remember_ids(kb_id, [doc.id for doc in documents], pkl_folder="pkl/")
+		else:
+			vectorstore = FAISS.from_documents(
+				documents, get_embeddings(), distance_strategy="COSINE"
+			)
+			cache_vectorstore(kb_id, vectorstore, pkl_folder="pkl/")
 
-	vectorstore.save_local("pkl/", kb_id)
+		save_vectorstore(vectorstore, kb_id, pkl_folder="pkl/")
 
 	print("Document ingested successfully")
 	return "Document ingested successfully"
@@ -107,7 +210,7 @@ def save_result_v4(
 	strategy_data: str,
 	strategy_id: str,
 	agent_id: str,
-	created_at: str = datetime.now().isoformat(),
+	created_at: Optional[str] = None,
 ) -> str:
 	"""
 	This function is for future made KBs so that it doesnt have to be bounded to the session_id
@@ -115,49 +218,180 @@ def save_result_v4(
 
 	kb_id = f"{agent_id}"
 	text = f"Notification: {notification_key}"
-
-	is_exist = check_pkl_exists(kb_id, pkl_folder="./pkl/v4")
-
-	if (
-		check_if_reference_id_exists_in_kb(
-			kb_id=kb_id, strategy_id=strategy_id, pkl_folder="./pkl/v4"
-		)
-		and is_exist
-	):
-		logger.info(
-			f"Strategy with the `strategy_id` of {strategy_id} has already been before ingested for `kb_id` of {kb_id}"
+	if created_at is None:
+		created_at = datetime.now().isoformat()
+
+	with get_kb_lock(kb_id, pkl_folder="pkl/v4/"):
+		is_exist = check_pkl_exists(kb_id, pkl_folder="./pkl/v4")
+
+		if (
+			check_if_reference_id_exists_in_kb(
+				kb_id=kb_id, strategy_id=strategy_id, pkl_folder="./pkl/v4"
+			)
+			and is_exist
+		):
+			logger.info(
+				f"Strategy with the `strategy_id` of {strategy_id} has already been before ingested for `kb_id` of {kb_id}"
+			)
+			return f"Strategy with the `strategy_id` of {strategy_id} has already been before ingested for `kb_id` of {kb_id}"
+
+		document = Document(
+			page_content=text,
+			metadata={
+				"reference_id": strategy_id,
+				"strategy_data": strategy_data,
+				"created_at": created_at,
+			},
 		)
-		return f"Strategy with the `strategy_id` of {strategy_id} has already been before ingested for `kb_id` of {kb_id}"
-
-	document = Document(
-		page_content=text,
-		metadata={
-			"reference_id": strategy_id,
-			"strategy_data": strategy_data,
-			"created_at": created_at,
-		},
-	)
-	document.id = str(strategy_id)
+		document.id = str(strategy_id)
 
-	embeddings = get_embeddings()
+		vectorstore = get_vectorstore(kb_id, pkl_folder="pkl/v4/")
 
-	if is_exist:
-		vectorstore = FAISS.load_local(
-			"pkl/v4/",
-			embeddings,
-			kb_id,
-			allow_dangerous_deserialization=True,
-			distance_strategy="COSINE",
-		)
-		vectorstore.add_documents([document])
-	else:
-		vectorstore = FAISS.from_documents(
-			[document], embeddings, distance_strategy="COSINE"
-		)
+		if vectorstore is not None:
+			vectorstore.add_documents([document])
+			remember_ids(kb_id, [document.id], pkl_folder="pkl/v4/")
+		else:
+			vectorstore = FAISS.from_documents(
+				[document], get_embeddings(), distance_strategy="COSINE"
+			)
+			cache_vectorstore(kb_id, vectorstore, pkl_folder="pkl/v4/")
 
-	vectorstore.save_local("pkl/v4/", kb_id)
+		save_vectorstore(vectorstore, kb_id, pkl_folder="pkl/v4/")
 
 	logger.info(
 		f"Document ingested successfully for `agent_id`: {agent_id}, `strategy_id`: {strategy_id}"
 	)
 	return "Document ingested successfully"
+
+
+def ingest_documents(
+	kb_id: str, documents: List[Document], pkl_folder=PKL_PATH
+) -> List[bool]:
+	"""
+	Add several documents to one KB with a single embeddings request and a
+	single save. Documents whose id is already in the KB, or repeated within
+	`documents`, are skipped. Returns whether each document was ingested.
+
+	The embeddings request runs without the KB lock; ids are checked again under
+	the lock in case another request ingested them in the meantime.
+	"""
+	known_ids = set(get_known_ids(kb_id, pkl_folder))
+	candidates: Dict[str, Tuple[int, Document]] = {}
+	for i, document in enumerate(documents):
+		if document.id not in known_ids and document.id not in candidates:
+			candidates[document.id] = (i, document)
+
+	ingested = [False] * len(documents)
+	if not candidates:
+		return ingested
+
+	texts = [document.page_content for _, document in candidates.values()]
+	embeddings = get_embeddings().embed_documents(texts)
+
+	with get_kb_lock(kb_id, pkl_folder):
+		known_ids = get_known_ids(kb_id, pkl_folder)
+
+		text_embeddings = []
+		metadatas = []
+		ids = []
+		for (i, document), text, embedding in zip(
+			candidates.values(), texts, embeddings
+		):
+			if document.id in known_ids:
+				continue
+			text_embeddings.append((text, embedding))
+			metadatas.append(document.metadata)
+			ids.append(document.id)
+			ingested[i] = True
+
+		if not ids:
+			return ingested
+
+		vectorstore = get_vectorstore(kb_id, pkl_folder)
+		if vectorstore is not None:
+			vectorstore.add_embeddings(text_embeddings, metadatas=metadatas, ids=ids)
+			remember_ids(kb_id, ids, pkl_folder)
+		else:
+			vectorstore = FAISS.from_embeddings(
+				text_embeddings,
+				get_embeddings(),
+				metadatas=metadatas,
+				ids=ids,
+				distance_strategy="COSINE",
+			)
+			cache_vectorstore(kb_id, vectorstore, pkl_folder)
+
+		save_vectorstore(vectorstore, kb_id, pkl_folder)
+
+	return ingested
+
+
+def save_result_batch(items: List[Dict[str, str]]) -> List[str]:
+	"""
+	Batch version of `save_result`, items being its keyword arguments.
+	Items are grouped per KB so every KB is embedded and saved once per batch.
+	"""
+	outputs = [""] * len(items)
+	documents_by_kb: Dict[str, List[Tuple[int, Document]]] = {}
+
+	for i, item in enumerate(items):
+		document = Document(
+			page_content=f"Strategy: {item['strategy']}\n",
+			metadata={
+				"reference_id": item["reference_id"],
+				"strategy_data": item["strategy_data"],
+				"created_at": item["created_at"],
+			},
+		)
+		document.id = str(item["reference_id"])
+
+		kb_id = f"{item['agent_id']}_{item['session_id']}"
+		documents_by_kb.setdefault(kb_id, []).append((i, document))
+
+	for kb_id, indexed_documents in documents_by_kb.items():
+		indexes, documents = zip(*indexed_documents)
+		for i, is_new in zip(indexes, ingest_documents(kb_id, list(documents))):
+			outputs[i] = (
+				"Document ingested successfully"
+				if is_new
+				else "Document already exists"
+			)
+
+	logger.info(f"Batch of {len(items)} documents processed")
+	return outputs
+
+
+def save_result_batch_v4(items: List[Dict[str, str]]) -> List[str]:
+	"""
+	Batch version of `save_result_v4`, items being its keyword arguments.
+	Items are grouped per KB so every KB is embedded and saved once per batch.
+	"""
+	outputs = [""] * len(items)
+	documents_by_kb: Dict[str, List[Tuple[int, Document]]] = {}
+
+	for i, item in enumerate(items):
+		document = Document(
+			page_content=f"Notification: {item['notification_key']}",
+			metadata={
+				"reference_id": item["strategy_id"],
+				"strategy_data": item["strategy_data"],
+				"created_at": item["created_at"],
+			},
+		)
+		document.id = str(item["strategy_id"])
+
+		kb_id = f"{item['agent_id']}"
+		documents_by_kb.setdefault(kb_id, []).append((i, document))
+
+	for kb_id, indexed_documents in documents_by_kb.items():
+		indexes, documents = zip(*indexed_documents)
+		is_new_list = ingest_documents(kb_id, list(documents), pkl_folder="pkl/v4/")
+		for i, document, is_new in zip(indexes, documents, is_new_list):
+			outputs[i] = (
+				"Document ingested successfully"
+				if is_new
+				else f"Strategy with the `strategy_id` of {document.id} has already been before ingested for `kb_id` of {kb_id}"
+			)
+
+	logger.info(f"Batch of {len(items)} documents processed")
+	return outputs
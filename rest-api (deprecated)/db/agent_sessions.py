@@ -1,15 +1,45 @@
+import logging
+
 from utils.utils import db_connection_decorator, delete_none
 
+logger = logging.getLogger(__name__)
+
 @db_connection_decorator
 def insert_agent_sessions_db(cursor, insert_dict):
     """Insert a new agent session record"""
     columns = ", ".join(insert_dict.keys())
     values = ", ".join(["?" for _ in insert_dict.values()])
     query = f"INSERT INTO sup_agent_sessions ({columns}) VALUES ({values})"
-    cursor.execute(query, list(insert_dict.values()))
+    cursor.execute(query, tuple(insert_dict.values()))
     return True
 
 
+@db_connection_decorator
+def insert_agent_sessions_if_agent_exists_db(cursor, insert_dict):
+    """Insert a new agent session record if its agent exists, in one transaction"""
+    cursor.execute(
+        "SELECT 1 FROM sup_agents WHERE agent_id = ? LIMIT 1",
+        (insert_dict.get("agent_id"),),
+    )
+    if cursor.fetchone() is None:
+        return False
+
+    columns = ", ".join(insert_dict.keys())
+    values = ", ".join(["?" for _ in insert_dict.values()])
+    query = f"INSERT INTO sup_agent_sessions ({columns}) VALUES ({values})"
+    cursor.execute(query, tuple(insert_dict.values()))
+    return True
+
+
+@db_connection_decorator
+def get_agent_session_by_id_db(cursor, session_id, result_columns: list):
+    """Retrieve a single agent session by session_id, or None if it doesn't exist"""
+    select_clause = ", ".join(result_columns) if result_columns else "*"
+    query = f"SELECT {select_clause} FROM sup_agent_sessions WHERE session_id = ?"
+    cursor.execute(query + " LIMIT 1", (session_id,))
+    return cursor.fetchone()
+
+
 @db_connection_decorator
 def update_agent_sessions_db(cursor, set_dict, where_dict):
     """Update existing agent session records"""
@@ -17,7 +47,7 @@ def update_agent_sessions_db(cursor, set_dict, where_dict):
     set_clause = ", ".join([f"{key} = ?" for key in set_dict.keys()])
     where_clause = " AND ".join([f"{key} = ?" for key in where_dict.keys()])
     query = f"UPDATE sup_agent_sessions SET {set_clause} WHERE {where_clause}"
-    cursor.execute(query, list(set_dict.values()) + list(where_dict.values()))
+    cursor.execute(query, (*set_dict.values(), *where_dict.values()))
     return True
 
 
@@ -48,15 +78,16 @@ def get_all_agent_sessions_db(cursor, result_columns: list, where_conditions: di
     
     query += f" LIMIT ? OFFSET ?"
     
-    # Debugging
-    print(query)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("query=%s", query)
 
     # Execute main query
-    cursor.execute(query, list(where_conditions.values()) + [page_size, offset])
+    where_values = tuple(where_conditions.values())
+    cursor.execute(query, (*where_values, page_size, offset))
     result = cursor.fetchall()
 
     # Execute count query
-    cursor.execute(count_query, list(where_conditions.values()))
+    cursor.execute(count_query, where_values)
     count = cursor.fetchone()
 
     return count["sum"], result
@@ -1,5 +1,9 @@
+import logging
+
 from utils.utils import db_connection_decorator, delete_none
 
+logger = logging.getLogger(__name__)
+
 
 @db_connection_decorator
 def insert_agents_db(cursor, insert_dict):
@@ -7,7 +11,7 @@ def insert_agents_db(cursor, insert_dict):
     columns = ", ".join(insert_dict.keys())
     values = ", ".join(["?" for _ in insert_dict.values()])
     query = f"INSERT INTO sup_agents ({columns}) VALUES ({values})"
-    cursor.execute(query, list(insert_dict.values()))
+    cursor.execute(query, tuple(insert_dict.values()))
     return True
 
 
@@ -18,7 +22,7 @@ def update_agents_db(cursor, set_dict, where_dict):
     set_clause = ", ".join([f"{key} = ?" for key in set_dict.keys()])
     where_clause = " AND ".join([f"{key} = ?" for key in where_dict.keys()])
     query = f"UPDATE sup_agents SET {set_clause} WHERE {where_clause}"
-    cursor.execute(query, list(set_dict.values()) + list(where_dict.values()))
+    cursor.execute(query, (*set_dict.values(), *where_dict.values()))
     return True
 
 
@@ -49,15 +53,16 @@ def get_all_agents_db(cursor, result_columns: list, where_conditions: dict, pagi
     
     query += f" LIMIT ? OFFSET ?"
     
-    # Debugging
-    print(query)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("query=%s", query)
 
     # Execute main query
-    cursor.execute(query, list(where_conditions.values()) + [page_size, offset])
+    where_values = tuple(where_conditions.values())
+    cursor.execute(query, (*where_values, page_size, offset))
     result = cursor.fetchall()
 
     # Execute count query
-    cursor.execute(count_query, list(where_conditions.values()))
+    cursor.execute(count_query, where_values)
     count = cursor.fetchone()
 
     return count["sum"], result
@@ -19,7 +19,7 @@ def insert_notifications_prevent_duplicate_db(cursor, insert_dict) -> str:
         if not existing:
             # Insert new record
             query = f"INSERT INTO sup_notifications ({columns}) VALUES ({values})"
-            cursor.execute(query, list(insert_dict.values()))
+            cursor.execute(query, tuple(insert_dict.values()))
         return "success"
     except Exception as e:
         return str(e)
@@ -48,7 +48,7 @@ def insert_notifications_db(cursor, insert_dict) -> str:
         columns = ", ".join(insert_dict.keys())
         values = ", ".join(["?" for _ in insert_dict.values()])
         query = f"INSERT INTO sup_notifications ({columns}) VALUES ({values})"
-        cursor.execute(query, list(insert_dict.values()))
+        cursor.execute(query, tuple(insert_dict.values()))
         return "success"
     except Exception as e:
         return str(e)
@@ -62,7 +62,7 @@ def update_notifications_db(cursor, set_dict, where_dict) -> str:
         set_clause = ", ".join([f"{key} = ?" for key in set_dict.keys()])
         where_clause = " AND ".join([f"{key} = ?" for key in where_dict.keys()])
         query = f"UPDATE sup_notifications SET {set_clause} WHERE {where_clause}"
-        cursor.execute(query, list(set_dict.values()) + list(where_dict.values()))
+        cursor.execute(query, (*set_dict.values(), *where_dict.values()))
         return "success"
     except Exception as e:
         return str(e)
@@ -91,9 +91,10 @@ def get_all_notifications_db(cursor, result_columns: list, where_conditions: dic
             count_query += f" {order_by_clause}"
         query += f" LIMIT ? OFFSET ?"
 
-        cursor.execute(query, list(where_conditions.values()) + [page_size, offset])
+        where_values = tuple(where_conditions.values())
+        cursor.execute(query, (*where_values, page_size, offset))
         result = cursor.fetchall()
-        cursor.execute(count_query, list(where_conditions.values()))
+        cursor.execute(count_query, where_values)
         count = cursor.fetchone()
         return ("success", count["sum"], result)
     except Exception as e:
@@ -132,7 +133,7 @@ def get_all_notifications_old_db(cursor, result_columns: list, where_conditions:
         count_query += f" {order_by_clause}"
     query += f" LIMIT ? OFFSET ?"
 
-    cursor.execute(query, where_values + [page_size, offset])
+    cursor.execute(query, (*where_values, page_size, offset))
     result = cursor.fetchall()
     cursor.execute(count_query, where_values)
     count = cursor.fetchone()
@@ -41,6 +41,6 @@ def insert_payments(cursor, insert_dict):
     columns = ", ".join(insert_dict.keys())
     values = ", ".join(["?" for _ in insert_dict.values()])  # SQLite uses ? placeholders
     query = f"INSERT INTO sup_payments ({columns}) VALUES ({values})"
-    cursor.execute(query, list(insert_dict.values()))
+    cursor.execute(query, tuple(insert_dict.values()))
 
     return True
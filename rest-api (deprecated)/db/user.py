@@ -1,5 +1,9 @@
+import logging
+
 from utils.utils import db_connection_decorator, delete_none
 
+logger = logging.getLogger(__name__)
+
 
 @db_connection_decorator
 def insert_users_db(cursor, insert_dict):
@@ -7,7 +11,7 @@ def insert_users_db(cursor, insert_dict):
     columns = ", ".join(insert_dict.keys())
     values = ", ".join(["?" for _ in insert_dict.values()])  # SQLite uses ? placeholders
     query = f"INSERT INTO sup_users ({columns}) VALUES ({values})"
-    cursor.execute(query, list(insert_dict.values()))
+    cursor.execute(query, tuple(insert_dict.values()))
     return True
 
 
@@ -18,7 +22,7 @@ def update_users_db(cursor, set_dict, where_dict):
     set_clause = ", ".join([f"{key} = ?" for key in set_dict.keys()])
     where_clause = " AND ".join([f"{key} = ?" for key in where_dict.keys()])
     query = f"UPDATE sup_users SET {set_clause} WHERE {where_clause}"
-    cursor.execute(query, list(set_dict.values()) + list(where_dict.values()))
+    cursor.execute(query, (*set_dict.values(), *where_dict.values()))
     return True
 
 
@@ -51,9 +55,11 @@ def get_all_users_db(
         count_query += f" {order_by_clause}"
     query += f" {limit_clause}"
 
-    print(query)
-    cursor.execute(query, list(where_conditions.values()))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("query=%s", query)
+    where_values = tuple(where_conditions.values())
+    cursor.execute(query, where_values)
     result = cursor.fetchall()
-    cursor.execute(count_query, list(where_conditions.values()))
+    cursor.execute(count_query, where_values)
     count = cursor.fetchone()["sum"]
     return count, result
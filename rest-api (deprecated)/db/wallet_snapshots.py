@@ -1,24 +1,114 @@
-from utils.utils import db_connection_decorator, delete_none
+import logging
+import threading
+import time
+from functools import lru_cache, wraps
 
+from utils.utils import db_connection_decorator, delete_none, open_db_connection
 
+logger = logging.getLogger(__name__)
+
+# Columns that may appear in generated SQL; keys are also sorted so the same
+# column set always yields the same SQL text and hits sqlite3's statement cache
+ALLOWED_COLS = frozenset(
+    ["id", "snapshot_id", "agent_id", "total_value_usd", "assets", "snapshot_time"]
+)
+
+# Prebuilt ORDER BY clause per sortable column
+ORDER_CLAUSES = {
+    col: f"ORDER BY sup_wallet_snapshots.{col} ASC" for col in sorted(ALLOWED_COLS)
+}
+
+# Past this OFFSET, pages are fetched with a deferred join on the id index
+DEFERRED_JOIN_MIN_OFFSET = 1000
+
+# Rows per executemany call in bulk inserts
+BULK_INSERT_CHUNK_SIZE = 500
+
+# Rows read from the cursor at a time when streaming results
+STREAM_BATCH_SIZE = 200
+
+# Recent COUNT results per filter set, as {key: (expires_at, count)}
+COUNT_CACHE_TTL = 30
+_count_cache = {}
+_count_cache_lock = threading.Lock()
+
+
+def check_columns(columns):
+    """Rejects column names that are not in the sup_wallet_snapshots whitelist"""
+    unknown = set(columns) - ALLOWED_COLS
+    if unknown:
+        raise ValueError(f"Unknown sup_wallet_snapshots columns: {sorted(unknown)}")
+
+
+def clears_count_cache(func):
+    """Drops cached COUNT results once func's transaction has committed
+
+    Stacked above db_connection_decorator, so a rolled back write leaves the
+    cache alone.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        result = func(*args, **kwargs)
+        with _count_cache_lock:
+            _count_cache.clear()
+        return result
+
+    return wrapper
+
+
+@lru_cache(maxsize=64)
+def insert_query(columns):
+    """INSERT statement for a sorted tuple of columns"""
+    check_columns(columns)
+    values = ", ".join(["?" for _ in columns])  # SQLite uses ? placeholders
+    return f"INSERT INTO sup_wallet_snapshots ({', '.join(columns)}) VALUES ({values})"
+
+
+@clears_count_cache
 @db_connection_decorator
 def insert_wallet_snapshots_db(cursor, insert_dict):
     """Insert a new wallet snapshot (SQLite version)"""
-    columns = ", ".join(insert_dict.keys())
-    values = ", ".join(["?" for _ in insert_dict.values()])  # SQLite uses ? placeholders
-    query = f"INSERT INTO sup_wallet_snapshots ({columns}) VALUES ({values})"
-    cursor.execute(query, list(insert_dict.values()))
+    columns = tuple(sorted(insert_dict))
+    cursor.execute(insert_query(columns), tuple(map(insert_dict.__getitem__, columns)))
     return True
 
 
+@clears_count_cache
+@db_connection_decorator
+def insert_wallet_snapshots_bulk_db(cursor, insert_dicts):
+    """Insert many wallet snapshots with the same keys in one transaction"""
+    if not insert_dicts:
+        return True
+
+    columns = tuple(sorted(insert_dicts[0]))
+    query = insert_query(columns)
+    for start in range(0, len(insert_dicts), BULK_INSERT_CHUNK_SIZE):
+        chunk = insert_dicts[start : start + BULK_INSERT_CHUNK_SIZE]
+        cursor.executemany(
+            query, [tuple(map(row.__getitem__, columns)) for row in chunk]
+        )
+    return True
+
+
+@clears_count_cache
 @db_connection_decorator
 def update_wallet_snapshots_db(cursor, set_dict, where_dict):
     """Update existing chat wallet snapshots (SQLite version)"""
     delete_none(set_dict)
-    set_clause = ", ".join([f"{key} = ?" for key in set_dict.keys()])
-    where_clause = " AND ".join([f"{key} = ?" for key in where_dict.keys()])
+    set_keys = sorted(set_dict)
+    where_keys = sorted(where_dict)
+    check_columns(set_keys + where_keys)
+    set_clause = ", ".join([f"{key} = ?" for key in set_keys])
+    where_clause = " AND ".join([f"{key} = ?" for key in where_keys])
     query = f"UPDATE sup_wallet_snapshots SET {set_clause} WHERE {where_clause}"
-    cursor.execute(query, list(set_dict.values()) + list(where_dict.values()))
+    cursor.execute(
+        query,
+        (
+            *map(set_dict.__getitem__, set_keys),
+            *map(where_dict.__getitem__, where_keys),
+        ),
+    )
     return True
 
 
@@ -26,34 +116,131 @@ def update_wallet_snapshots_db(cursor, set_dict, where_dict):
 def get_all_wallet_snapshots_db(
     cursor, result_columns: list, where_conditions: dict, pagination
 ):
-    """Retrieve wallet snapshots with pagination (SQLite version)"""
-    delete_none(where_conditions)
-    select_clause = ", ".join(result_columns) if result_columns else "*"
-    where_clause = " AND ".join([f"{col} = ?" for col in where_conditions.keys()])
-    order_by_clause = (
-        f"ORDER BY sup_wallet_snapshots.{pagination['sort_by']} ASC"
-        if "sort_by" in pagination
-        else ""
+    """Retrieve wallet snapshots with pagination (SQLite version)
+
+    If pagination has an "after" value, rows are fetched with keyset pagination:
+    only rows whose sort_by column (default "id") is greater than "after" are
+    returned, so the database seeks the index instead of skipping an OFFSET.
+    The sort_by value of the last returned row is the "after" of the next page;
+    sort_by should be unique for this to not skip rows.
+
+    Returns (count, rows, has_more); has_more comes from fetching one row past
+    the page. Totals are cached per filter set for COUNT_CACHE_TTL seconds, and
+    with pagination["skip_count"] no count is run and count is None.
+    """
+    where_keys = sorted(where_conditions)
+    check_columns(
+        where_keys
+        + list(result_columns or [])
+        + ([pagination["sort_by"]] if "sort_by" in pagination else [])
     )
-    page = pagination.get("page", 1)
+    select_clause = ", ".join(result_columns) if result_columns else "*"
+    where_clause = " AND ".join([f"{col} = ?" for col in where_keys])
+    where_values = tuple(map(where_conditions.__getitem__, where_keys))
     page_size = pagination.get("page_size", 800)
-    offset = (page - 1) * page_size
-    limit_clause = f"LIMIT {page_size} OFFSET {offset}"
+    fetch_size = page_size + 1
+
+    if "after" in pagination:
+        sort_by = pagination.get("sort_by", "id")
+        seek_clause = f"sup_wallet_snapshots.{sort_by} > ?"
+        query_where = (
+            f"{where_clause} AND {seek_clause}" if where_clause else seek_clause
+        )
+        query = (
+            f"SELECT {select_clause} FROM sup_wallet_snapshots WHERE {query_where}"
+            f" {ORDER_CLAUSES[sort_by]} LIMIT ?"
+        )
+        query_values = (*where_values, pagination["after"], fetch_size)
+    else:
+        order_by_clause = ORDER_CLAUSES.get(pagination.get("sort_by"), "")
+        page = pagination.get("page", 1)
+        offset = (page - 1) * page_size
+        limit_clause = "LIMIT ? OFFSET ?"
+
+        if offset >= DEFERRED_JOIN_MIN_OFFSET and result_columns != ["id"]:
+            # Skip the offset rows on ids only, then read full rows for one page
+            order_by_clause = order_by_clause or ORDER_CLAUSES["id"]
+            page_ids_query = "SELECT sup_wallet_snapshots.id FROM sup_wallet_snapshots"
+            if where_clause:
+                page_ids_query += f" WHERE {where_clause}"
+            page_ids_query += f" {order_by_clause} {limit_clause}"
+
+            qualified_select = (
+                ", ".join(f"sup_wallet_snapshots.{col}" for col in result_columns)
+                if result_columns
+                else "sup_wallet_snapshots.*"
+            )
+            query = (
+                f"SELECT {qualified_select} FROM sup_wallet_snapshots"
+                f" JOIN ({page_ids_query}) AS page"
+                f" ON sup_wallet_snapshots.id = page.id {order_by_clause}"
+            )
+        else:
+            query = f"SELECT {select_clause} FROM sup_wallet_snapshots"
+            if where_clause:
+                query += f" WHERE {where_clause}"
+            if order_by_clause:
+                query += f" {order_by_clause}"
+            query += f" {limit_clause}"
+        query_values = (*where_values, fetch_size, offset)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("query=%s", query)
+    cursor.execute(query, query_values)
+    result = cursor.fetchall()
+    has_more = len(result) > page_size
+    result = result[:page_size]
+
+    if pagination.get("skip_count", False):
+        return None, result, has_more
 
     # Get total count for pagination
+    count_key = frozenset(where_conditions.items())
+    with _count_cache_lock:
+        cached = _count_cache.get(count_key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1], result, has_more
+
     count_query = "SELECT COUNT(1) as sum FROM sup_wallet_snapshots"
-    query = f"SELECT {select_clause} FROM sup_wallet_snapshots"
     if where_clause:
-        query += f" WHERE {where_clause}"
         count_query += f" WHERE {where_clause}"
-    if order_by_clause:
-        query += f" {order_by_clause}"
-        count_query += f" {order_by_clause}"
-    query += f" {limit_clause}"
-
-    print(query)
-    cursor.execute(query, list(where_conditions.values()))
-    result = cursor.fetchall()
-    cursor.execute(count_query, list(where_conditions.values()))
+    cursor.execute(count_query, where_values)
     count = cursor.fetchone()["sum"]
-    return count, result
+    with _count_cache_lock:
+        _count_cache[count_key] = (time.monotonic() + COUNT_CACHE_TTL, count)
+    return count, result, has_more
+
+
+def iter_wallet_snapshots_db(
+    result_columns: list, where_conditions: dict, batch_size=STREAM_BATCH_SIZE
+):
+    """Stream wallet snapshots ordered by id without building the full result list
+
+    Columns are validated up front; the returned generator then reads rows from
+    its own connection batch_size at a time and closes it when exhausted. The
+    connection is not bound to one thread, so the generator can be consumed by
+    StreamingResponse, which may advance it from different worker threads.
+    """
+    where_keys = sorted(where_conditions)
+    check_columns(where_keys + list(result_columns or []))
+    select_clause = ", ".join(result_columns) if result_columns else "*"
+    query = f"SELECT {select_clause} FROM sup_wallet_snapshots"
+    if where_keys:
+        query += " WHERE " + " AND ".join([f"{col} = ?" for col in where_keys])
+    query += " ORDER BY sup_wallet_snapshots.id ASC"
+    where_values = tuple(map(where_conditions.__getitem__, where_keys))
+
+    def rows():
+        connection = open_db_connection(check_same_thread=False)
+        try:
+            cursor = connection.execute(query, where_values)
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                for row in batch:
+                    yield dict(row)
+        finally:
+            connection.close()
+
+    return rows()
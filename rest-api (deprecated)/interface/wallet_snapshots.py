@@ -17,8 +17,19 @@ class WalletSnapshotsParams(BaseModel):
     assets:          Optional[str] = Field(None)
 
 
+class WalletSnapshotsBatchParams(BaseModel):
+    wallet_snapshots: List[WalletSnapshotsParams] = Field(...)
+
+
 class WalletSnapshotsUpdateParams(BaseModel):
     snapshot_id:     Optional[str] = Field(None)
     agent_id:        Optional[str] = Field(None)
     total_value_usd: Optional[float] = Field(None)
     assets:          Optional[str] = Field(None)
+
+
+class WalletSnapshotsGetParams(WalletSnapshotsUpdateParams):
+    page:            Optional[int] = Field(None, ge=1)
+    page_size:       Optional[int] = Field(None, ge=1, le=800)
+    after:           Optional[int] = Field(None)  # last id of the previous page
+    skip_count:      bool = Field(False)
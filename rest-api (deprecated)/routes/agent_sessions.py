@@ -1,10 +1,7 @@
-import uuid
-import db.agents                as db_a
 import db.agent_sessions        as db_as
-import interface.agents         as intf_a
 import interface.agent_sessions as intf_as
 
-from utils.utils import X_API_KEY_DEPS
+from utils.utils import X_API_KEY_DEPS, uuid7_hex
 from fastapi     import APIRouter, Request, HTTPException
 
 router = APIRouter()
@@ -15,23 +12,19 @@ def create_agent_sessions(
     _x_api_key: X_API_KEY_DEPS, request: Request, params: intf_as.AgentSessionsParams
 ):
     """Creates a new agent session."""
-    # Check if agent exists first
-    count, results = db_a.get_all_agents_db(
-        intf_a.RESULT_COLS, {"agent_id": params.agent_id}, {}
-    )
+    req_data = params.model_dump(exclude_none=True, exclude_unset=True)
+    if not params.session_id:
+        req_data["session_id"] = uuid7_hex()
+
+    # Agent existence check and insert share one connection and transaction
+    inserted = db_as.insert_agent_sessions_if_agent_exists_db(req_data)
     # If no agent found with given agent_id, return 404 error
-    if count == 0:
+    if not inserted:
         raise HTTPException(
             status_code=404,
             detail=f"Agent with ID {params.agent_id} does not exist. Please create agent first.",
         )
 
-    # Continue with session creation if agent exists
-    req_data = params.__dict__
-    if not params.session_id:
-        req_data["session_id"] = str(uuid.uuid4())
-
-    db_as.insert_agent_sessions_db(req_data)
     return {
         "status": "success",
         "msg": "agent session inserted",
@@ -49,7 +42,9 @@ def update_agent_sessions(
     where_dict = {"session_id": params.session_id}
     if params.agent_id:
         where_dict["agent_id"] = params.agent_id
-    db_as.update_agent_sessions_db(params.__dict__, where_dict)
+    db_as.update_agent_sessions_db(
+        params.model_dump(exclude_none=True, exclude_unset=True), where_dict
+    )
     return {"status": "success", "msg": "agent session updated"}
 
 
@@ -66,26 +61,34 @@ def get_agent_sessions(
     """
     # If session_id is provided, get single session
     if params.session_id:
-        count, results = db_as.get_all_agent_sessions_db(
-            intf_as.RESULT_COLS, {"session_id": params.session_id}, {}
+        result = db_as.get_agent_session_by_id_db(
+            params.session_id, intf_as.RESULT_COLS
         )
-        return {"status": "success", "data": results[0]}
+        if result is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Agent session with ID {params.session_id} does not exist.",
+            )
+        return {"status": "success", "data": result}
     else:
-        count, results = db_as.get_all_agent_sessions_db(
-            intf_as.RESULT_COLS, params.__dict__, {}
-        )
-        return {"status": "success", "data": results, "total_items": count}
+        return list_agent_sessions(params)
 
 
 @router.post("/api_v1/agent_sessions/get_v2")
-def get_agent_sessions(
+def get_agent_sessions_v2(
     _x_api_key: X_API_KEY_DEPS,
     request: Request,
     params: intf_as.AgentSessionsUpdateParams,
 ):
     """Alternative endpoint to retrieve agent sessions (v2)."""
-    # Get all sessions matching parameters
+    return list_agent_sessions(params)
+
+
+def list_agent_sessions(params: intf_as.AgentSessionsUpdateParams):
+    """Get all sessions matching parameters, shared by the get and get_v2 routes."""
     count, results = db_as.get_all_agent_sessions_db(
-        intf_as.RESULT_COLS, params.__dict__, {}
+        intf_as.RESULT_COLS,
+        params.model_dump(exclude_none=True, exclude_unset=True),
+        {},
     )
     return {"status": "success", "data": results, "total_items": count}
@@ -1,9 +1,11 @@
+import json
 import uuid
 import db.wallet_snapshots        as db_ws
 import interface.wallet_snapshots as intf_ws
 
-from fastapi     import APIRouter, Request
-from utils.utils import X_API_KEY_DEPS
+from fastapi           import APIRouter, Request
+from fastapi.responses import StreamingResponse
+from utils.utils       import X_API_KEY_DEPS
 
 router = APIRouter()
 
@@ -13,7 +15,7 @@ def create_wallet_snapshots(
     _x_api_key: X_API_KEY_DEPS, request: Request, params: intf_ws.WalletSnapshotsParams
 ):
     """Create wallet snapshot record"""
-    req_data = params.__dict__
+    req_data = params.model_dump(exclude_none=True, exclude_unset=True)
     req_data["snapshot_id"] = str(uuid.uuid4())
     db_ws.insert_wallet_snapshots_db(req_data)
     return {
@@ -23,6 +25,26 @@ def create_wallet_snapshots(
     }
 
 
+@router.post("/api_v1/wallet_snapshots/create_batch")
+def create_batch_wallet_snapshots(
+    _x_api_key: X_API_KEY_DEPS,
+    request: Request,
+    params: intf_ws.WalletSnapshotsBatchParams,
+):
+    """Create multiple wallet snapshot records in a single batch operation"""
+    batch_data = []
+    for wallet_snapshot in params.wallet_snapshots:
+        req_data = wallet_snapshot.model_dump()
+        req_data["snapshot_id"] = str(uuid.uuid4())
+        batch_data.append(req_data)
+    db_ws.insert_wallet_snapshots_bulk_db(batch_data)
+    return {
+        "status": "success",
+        "msg": "wallet snapshots inserted",
+        "data": {"snapshot_ids": [row["snapshot_id"] for row in batch_data]},
+    }
+
+
 @router.post("/api_v1/wallet_snapshots/update")
 def update_wallet_snapshots(
     _x_api_key: X_API_KEY_DEPS,
@@ -31,7 +53,8 @@ def update_wallet_snapshots(
 ):
     """Update wallet snapshot record"""
     db_ws.update_wallet_snapshots_db(
-        params.__dict__, {"snapshot_id": params.snapshot_id}
+        params.model_dump(exclude_none=True, exclude_unset=True),
+        {"snapshot_id": params.snapshot_id},
     )
     return {"status": "success", "msg": "wallet snapshots updated"}
 
@@ -40,17 +63,51 @@ def update_wallet_snapshots(
 def get_wallet_snapshots(
     _x_api_key: X_API_KEY_DEPS,
     request: Request,
-    params: intf_ws.WalletSnapshotsUpdateParams,
+    params: intf_ws.WalletSnapshotsGetParams,
 ):
-    """Get wallet snapshot record"""
+    """Get wallet snapshot record
+
+    Pages by id: pass the "next_after" of a response as "after" to read the
+    next page, or "page" for the offset fallback. "skip_count" leaves out the
+    total_items count.
+    """
     if params.snapshot_id:
-        count, results = db_ws.get_all_wallet_snapshots_db(
+        count, results, has_more = db_ws.get_all_wallet_snapshots_db(
             intf_ws.RESULT_COLS, {"snapshot_id": params.snapshot_id}, {}
         )
         return {"status": "success", "data": results[0]}
     else:
-        count, results = db_ws.get_all_wallet_snapshots_db(
-            intf_ws.RESULT_COLS, params.__dict__, {}
+        pagination = params.model_dump(
+            exclude_none=True, include={"page", "page_size", "after", "skip_count"}
+        )
+        count, results, has_more = db_ws.get_all_wallet_snapshots_db(
+            intf_ws.RESULT_COLS,
+            params.model_dump(
+                exclude_none=True,
+                exclude_unset=True,
+                include=set(intf_ws.WalletSnapshotsUpdateParams.model_fields),
+            ),
+            pagination,
         )
-        return {"status": "success", "data": results, "total_items": count}
+        return {
+            "status": "success",
+            "data": results,
+            "total_items": count,
+            "has_more": has_more,
+            "next_after": results[-1]["id"] if has_more else None,
+        }
+
 
+@router.post("/api_v1/wallet_snapshots/export")
+def export_wallet_snapshots(
+    _x_api_key: X_API_KEY_DEPS,
+    request: Request,
+    params: intf_ws.WalletSnapshotsUpdateParams,
+):
+    """Stream all matching wallet snapshot records as newline-delimited JSON"""
+    rows = db_ws.iter_wallet_snapshots_db(
+        intf_ws.RESULT_COLS, params.model_dump(exclude_none=True, exclude_unset=True)
+    )
+    return StreamingResponse(
+        (json.dumps(row) + "\n" for row in rows), media_type="application/x-ndjson"
+    )
@@ -1,4 +1,8 @@
+import logging
+import os
 import sqlite3
+import threading
+import time
 from typing            import Annotated
 from pathlib           import Path
 from functools         import wraps
@@ -14,30 +18,63 @@ db_config = {
     "database": MYSQL_DATABASE,
 }
 
+logger = logging.getLogger(__name__)
+
+# One SQLite connection per worker thread, opened on first use and then reused
+_local = threading.local()
+
+
+def open_db_connection(check_same_thread=True):
+    """Opens a new SQLite connection with dictionary-like rows."""
+    # Define SQLite database file path
+    connection = sqlite3.connect("database.db", check_same_thread=check_same_thread)
+    connection.row_factory = sqlite3.Row  # Enables dictionary-like row access
+    return connection
+
+
+def get_db_connection():
+    """Returns the calling thread's SQLite connection, opening it if needed."""
+    connection = getattr(_local, "connection", None)
+    if connection is None:
+        connection = open_db_connection()
+        _local.connection = connection
+    return connection
+
+
 def db_connection_decorator(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        # Define SQLite database file path
-        connection = sqlite3.connect("database.db")
-        connection.row_factory = sqlite3.Row  # Enables dictionary-like row access
-        
+        connection = get_db_connection()
+        cursor = connection.cursor()
+
         try:
-            cursor = connection.cursor()
             result = func(cursor, *args, **kwargs)
             connection.commit()  # Commit changes if successful
-        except Exception as e:
+        except Exception:
             connection.rollback()  # Rollback in case of error
-            print(f"An error occurred: {e}")
+            logger.exception("db error in %s", func.__name__)
             raise
         finally:
-            cursor.close()
-            connection.close()  # Ensure connection is closed
-        
+            cursor.close()  # The connection stays open for the next call
+
         return result
-    
+
     return wrapper
 
 
+def uuid7_hex():
+    """
+    Returns a new UUIDv7 as 32 hex characters without dashes.
+    The leading 48 bits are the Unix time in milliseconds, so ids created later
+    sort after earlier ones and land at the end of the index instead of at
+    random positions.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return f"{value:032x}"
+
+
 def delete_none(data):
     """Removes all keys with None values from a dictionary."""
     save_key = []